@@ -1,8 +1,11 @@
 # Native libraries
+import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 # Third party libraries
 # Project libraries
-from qlty.utilities.selenium_utils import initialize_driver
+from qlty.utilities.selenium_utils import initialize_driver, invalidate_window_size
+from qlty.classes.core.webdriver_pool import driver_pool
 from qlty.qlty_tests import test_reporter
 from qlty.utilities.utils import setup_logger, dump_test_results, dump_logs, dump_screenshot
 from qlty.classes.integrations.saucelabs_integration import SaucelabsHelper
@@ -18,21 +21,34 @@ class QLTYTestCase(unittest.TestCase):
     Base test case class for QLTY test implementations
     Extends unittest.TestCase with framework-specific functionality
     """
-    #: Collection of webdriver instances for application interaction
-    drivers = []
+    #: Collection of webdriver instances for application interaction, assigned per instance in setUp
+    drivers = None
     #: Flag to enable/disable log collection during tearDown
     collect_logs = True
+    #: Run result error and failure counts recorded at setUp for Saucelabs result lookup
+    result_offsets = (0, 0)
 
     def setUp(self):
         """
         Initializes webdriver instance for test case execution
+        Checks out a pooled driver when :code:`config.POOL_SIZE` is greater than 0
         """
         logger.debug('Initializing new QLTY test case')
         self.drivers = []
         driver = None
+        if config.SAUCELABS_INTEGRATION:
+            # Track where this test case's results start in the shared run result
+            SaucelabsHelper.bookmark_result(self)
         try:
-            # Initialize webdriver instance
-            driver = initialize_driver(self, config.CURRENT_PLATFORM, force_driver_creation=False)
+            if config.POOL_SIZE > 0 and not config.MANAGED_DRIVERS:
+                # Check out a reusable webdriver instance from the pool
+                driver = driver_pool.acquire(self, config.CURRENT_PLATFORM)
+                # Cleanups run even when setUp or tearDown fail, so the driver is always returned to the pool
+                self.addCleanup(driver_pool.release, driver)
+                self.drivers.append(driver)
+            else:
+                # Initialize webdriver instance
+                driver = initialize_driver(self, config.CURRENT_PLATFORM, force_driver_creation=False)
         except Exception as error:
             logger.critical('Webdriver initialization failed. '
                             'Verify Appium server is running\nError:{}'.format(str(error)))
@@ -52,26 +68,52 @@ class QLTYTestCase(unittest.TestCase):
     def tearDown(self):
         """
         Terminates webdriver sessions and handles result reporting
+        Pooled drivers are returned to the pool by the cleanup registered in setUp instead of being terminated
+        Multiple drivers are processed concurrently, each storing its logs in a :code:`driver_N` directory
         Reports to Saucelabs if integration is enabled
         """
         # Register results with test reporter
         test_reporter.add_test_case_result(self)
         # Generate test results directory
+        method_results_dir = dump_test_results(self) if self.collect_logs else None
+
+        if len(self.drivers) <= 1:
+            for driver in self.drivers:
+                self._teardown_driver(driver, method_results_dir)
+            return
+
+        # Process drivers concurrently, each teardown step is a network round-trip for its own session
+        results_dirs = [None] * len(self.drivers)
         if self.collect_logs:
-            method_results_dir = dump_test_results(self)
+            # Keep artifacts of each driver apart to avoid concurrent writes to the same files
+            results_dirs = [os.path.join(method_results_dir, 'driver_{}'.format(index))
+                            for index in range(len(self.drivers))]
+            for results_dir in results_dirs:
+                os.makedirs(results_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+            list(executor.map(self._teardown_driver, self.drivers, results_dirs))
+
+    def _teardown_driver(self, driver, results_dir):
+        """
+        Collects artifacts, publishes results and releases a single webdriver session
 
-        # Process each webdriver associated with test case
-        for driver in self.drivers:
-            if self.collect_logs:
-                # Save system logs
-                dump_logs(method_results_dir, driver)
-                # Capture failure screenshot
-                dump_screenshot(method_results_dir, self, driver)
+        :param driver: Webdriver instance associated with the test case
+        :type driver: WebDriver
+        :param results_dir: Directory for logs and screenshots, None when log collection is disabled
+        :type results_dir: str
+        """
+        if self.collect_logs:
+            # Save system logs
+            dump_logs(results_dir, driver)
+            # Capture failure screenshot
+            dump_screenshot(results_dir, self, driver)
 
-            if config.SAUCELABS_INTEGRATION:
-                # Verify if driver is Saucelabs-enabled by checking capabilities
-                if 'sauce:options' in driver.caps:
-                    # Terminate driver and publish results to Saucelabs
-                    SaucelabsHelper.post_result(self, driver)
-            # Terminate driver session
+        if config.SAUCELABS_INTEGRATION:
+            # Verify if driver is Saucelabs-enabled by checking capabilities
+            if 'sauce:options' in driver.caps:
+                # Terminate driver and publish results to Saucelabs
+                SaucelabsHelper.post_result(self, driver)
+        if not driver_pool.owns(driver):
+            # Terminate driver session, pooled drivers are released by the cleanup registered in setUp
             driver.quit()
+            invalidate_window_size(driver)
@@ -1,5 +1,6 @@
 # Native libraries
 import datetime
+import time
 # Project libraries
 import string
 
@@ -17,10 +18,34 @@ class TestReporter:
     Manages test suite and test case result collection and tracking
     """
 
-    #: Dictionary containing results for all test cases
-    test_results = {}
-    #: Dictionary storing external test case identifiers
-    external_case_ids = {}
+    def __init__(self):
+        """
+        Initialize empty result collections for a test run
+        """
+        #: Dictionary containing results for all test cases
+        self.test_results = {}
+        #: Dictionary storing external test case identifiers
+        self.external_case_ids = {}
+
+    def reset(self):
+        """
+        Discards results collected by a previous test run
+        """
+        self.test_results.clear()
+        self.external_case_ids.clear()
+
+    def merge(self, test_results, external_case_ids):
+        """
+        Merges results collected by another reporter, used to combine results of parallel workers
+
+        :param test_results: Test case results keyed by test class and method name
+        :type test_results: dict
+        :param external_case_ids: External test case identifiers
+        :type external_case_ids: dict
+        """
+        for test_class, class_results in test_results.items():
+            self.test_results.setdefault(test_class, {}).update(class_results)
+        self.external_case_ids.update(external_case_ids)
 
     def register_test_case(self, test_case, case_ids: list[int], feature_name: string,
                            test_target: TestTarget):
@@ -51,11 +76,9 @@ class TestReporter:
         :type case_ids: list
         """
         logger.debug('Test case [{}] associated with test case IDs: {}'.format(test_case, case_ids))
-        test_class = test_case.__class__.__qualname__
-        test_method_name = test_case._testMethodName
-        self.test_results[test_class][test_method_name]['test_case_ids'] = case_ids
-        for case_id in case_ids:
-            self.external_case_ids[case_id] = case_id
+        entry = self.test_results[test_case.__class__.__qualname__][test_case._testMethodName]
+        entry['test_case_ids'] = case_ids
+        self.external_case_ids.update(zip(case_ids, case_ids))
 
     def add_test_case_result(self, test_case_result):
         """
@@ -65,17 +88,16 @@ class TestReporter:
         :param test_case_result: Test case instance extending unittest TestCase
         :type test_case_result: QLTYTestCase
         """
-        test_class = test_case_result.__class__.__qualname__
-        test_method_name = test_case_result._testMethodName
-        # Calculate test case execution duration
-        self.test_results[test_class][test_method_name]['end_time'] = datetime.datetime.now()
-        self.test_results[test_class][test_method_name]['duration'] = \
-            int((self.test_results[test_class][test_method_name]['end_time'] -
-                 self.test_results[test_class][test_method_name]['start_time']).total_seconds())
+        entry = self.test_results[test_case_result.__class__.__qualname__][test_case_result._testMethodName]
+        # Calculate test case execution duration from the monotonic clock
+        elapsed = time.monotonic() - entry['start_monotonic']
+        entry['duration'] = int(elapsed)
+        # Wall clock end time derived from the start timestamp for display purposes
+        entry['end_time'] = entry['start_time'] + datetime.timedelta(seconds=elapsed)
 
-        if test_case_result._outcome is not None:
-            if test_case_result._outcome.success:
-                self.test_results[test_class][test_method_name]['status'] = 'passed'
+        # Outcome is None when the test case is executed through debug()
+        if getattr(test_case_result._outcome, 'success', False):
+            entry['status'] = 'passed'
 
     def _add_test_case(self, test_case, feature_name, test_target):
         """
@@ -84,14 +106,14 @@ class TestReporter:
         :param test_case: Test case instance extending unittest TestCase
         :type test_case: QLTYTestCase
         """
-        if self.test_results.get(test_case.__class__.__qualname__) is None:
-            # Initialize test class entry if not present
-            self.test_results[test_case.__class__.__qualname__] = {}
+        # Initialize test class entry if not present
+        class_entry = self.test_results.setdefault(test_case.__class__.__qualname__, {})
 
         # Create test case entry under class name
-        self.test_results[test_case.__class__.__qualname__][test_case._testMethodName] = {
+        class_entry[test_case._testMethodName] = {
             'status': 'untested',
             'start_time': datetime.datetime.now(),
+            'start_monotonic': time.monotonic(),
             'end_time': None,
             'duration': None,
             'test_case_ids': [],
@@ -129,7 +151,7 @@ class TestReporter:
                 # setUp method failure detected (class or test case level)
                 logger.critical('SetUp method failure for Class or Test Case: {}'.format(test_case.description))
                 return
-            test_method_name = test_case._testMethodName
+            entry = self.test_results[test_class][test_case._testMethodName]
             # Record failure status and stack trace
-            self.test_results[test_class][test_method_name]['status'] = 'failed'
-            self.test_results[test_class][test_method_name]['message'] = stack_trace
+            entry['status'] = 'failed'
+            entry['message'] = stack_trace
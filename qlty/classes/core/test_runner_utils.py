@@ -1,5 +1,9 @@
 # Native libraries
+import json
 import pwd
+import sys
+import unittest
+from collections import Counter
 import os
 from pprint import pformat
 from datetime import datetime
@@ -25,6 +29,8 @@ class TestRunnerUtils:
     running_on_android_web_message = 'Chrome mobile for Android only, skipping'
     #: Console message for iOS web test execution
     running_on_ios_web_message = 'Safari for iOS only, skipping'
+    #: File in the working directory storing discovered test identifiers between runs
+    TEST_MANIFEST_FILE = '.qlty_test_manifest.json'
 
     @staticmethod
     def report(test_results, test_run_id, test_run_elapsed_time):
@@ -49,6 +55,84 @@ class TestRunnerUtils:
             logger.info('Saucelabs results: {}\n Search for test cases with prefix: {}'.format(
                 settings.SAUCELABS['URL'], get_unique_build_id()))
 
+    @staticmethod
+    def discover_tests(tests_dir):
+        """
+        Builds the test suite for every test case under tests_dir
+        When :code:`config.TEST_MANIFEST_CACHE` is enabled, reuses the test identifiers stored in
+        :code:`TEST_MANIFEST_FILE` while no test module was added, removed or modified, falling back to
+        full discovery otherwise
+
+        :param tests_dir: Absolute path to the tests directory
+        :type tests_dir: str
+        :return: Suite containing every discovered test case
+        :rtype: TestSuite
+        """
+        if not config.TEST_MANIFEST_CACHE:
+            return unittest.TestLoader().discover(tests_dir)
+
+        manifest_path = os.path.join(os.getcwd(), TestRunnerUtils.TEST_MANIFEST_FILE)
+        module_mtimes = TestRunnerUtils._get_module_mtimes(tests_dir)
+        try:
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            manifest = None
+
+        if manifest is not None and manifest.get('module_mtimes') == module_mtimes:
+            logger.debug('Loading test cases from manifest: {}'.format(manifest_path))
+            # Discovery imports test modules relative to the tests directory
+            if tests_dir not in sys.path:
+                sys.path.insert(0, tests_dir)
+            return unittest.TestLoader().loadTestsFromNames(manifest['test_ids'])
+
+        logger.debug('Test manifest missing or outdated, discovering test cases')
+        test_suite = unittest.TestLoader().discover(tests_dir)
+        test_ids = [test.id() for test in TestRunnerUtils.iterate_tests(test_suite)]
+        # Modules that failed to import must be reported by discovery on every run, skip persisting
+        if any(test_id.startswith('unittest.loader.') for test_id in test_ids):
+            logger.warning('Test modules failed to import, test manifest not updated')
+            return test_suite
+        try:
+            with open(manifest_path, 'w') as manifest_file:
+                json.dump({'module_mtimes': module_mtimes, 'test_ids': test_ids}, manifest_file)
+        except OSError as error:
+            logger.warning('Test manifest could not be saved\nError: {}'.format(error))
+        return test_suite
+
+    @staticmethod
+    def _get_module_mtimes(tests_dir):
+        """
+        Collects modification times for every python module under tests_dir
+
+        :param tests_dir: Absolute path to the tests directory
+        :type tests_dir: str
+        :return: Modification time in nanoseconds keyed by path relative to tests_dir
+        :rtype: dict
+        """
+        module_mtimes = {}
+        for root, dirs, files in os.walk(tests_dir):
+            for file_name in files:
+                if file_name.endswith('.py'):
+                    path = os.path.join(root, file_name)
+                    module_mtimes[os.path.relpath(path, tests_dir)] = os.stat(path).st_mtime_ns
+        return module_mtimes
+
+    @staticmethod
+    def iterate_tests(test_suite):
+        """
+        Flattens nested test suites into individual test cases
+
+        :param test_suite: Suite possibly containing nested suites
+        :type test_suite: TestSuite
+        :return: Generator of test cases
+        """
+        for test in test_suite:
+            if isinstance(test, unittest.TestSuite):
+                yield from TestRunnerUtils.iterate_tests(test)
+            else:
+                yield test
+
     @staticmethod
     def generate_test_run_id():
         """
@@ -60,6 +144,19 @@ class TestRunnerUtils:
         return '[{}] {} - LOCAL | {} '.format(datetime.now().strftime('%H:%M'),
                                               config.CURRENT_PLATFORM, pwd.getpwuid(os.getuid())[0])
 
+    @staticmethod
+    def running_on(*platforms):
+        """
+        Checks if current test run targets any of the given platforms with a single membership test,
+        for example :code:`TestRunnerUtils.running_on('ios', 'ios_web')`
+
+        :param platforms: Platform identifiers to match against
+        :type platforms: str
+        :return: True if the current platform is one of the given platforms, False otherwise
+        :rtype: bool
+        """
+        return config.CURRENT_PLATFORM in platforms
+
     @staticmethod
     def running_on_ios():
         """
@@ -120,7 +217,6 @@ class TestRunnerUtils:
         :return: Consolidated statistics dictionary
         :rtype: Dictionary
         """
-
         results = {
             'total_testcases': 0,
             'passed_testcases': 0,
@@ -130,20 +226,24 @@ class TestRunnerUtils:
         }
 
         # Aggregate test result statistics
-        for test_class, test_methods in test_results.items():
-            for test_method, result in test_methods.items():
-                if result['status'] == 'passed':
-                    results['passed_testcases'] += 1
-                elif result['status'] == 'failed':
-                    results['failed_testcases'] += 1
-                else:
-                    logger.warning('Unrecognized result status: {}'.format(result['status']))
+        status_counts = Counter(result['status']
+                                for test_methods in test_results.values()
+                                for result in test_methods.values())
+        results['passed_testcases'] = status_counts.pop('passed', 0)
+        results['failed_testcases'] = status_counts.pop('failed', 0)
+        # Registered test cases that never reported a result are not counted
+        status_counts.pop('untested', None)
+        if status_counts:
+            logger.warning('Unrecognized result statuses: %s', dict(status_counts))
 
         # Calculate totals and percentages
-        results['total_testcases'] = results['passed_testcases'] + results['failed_testcases']
-        # Calculate pass/fail percentages
-        results['passed_percentage'] = "{:.1f}%".format((results['passed_testcases'] / results['total_testcases']) * 100)
-        results['failed_percentage'] = "{:.1f}%".format((results['failed_testcases'] / results['total_testcases']) * 100)
+        total = results['passed_testcases'] + results['failed_testcases']
+        results['total_testcases'] = total
+        # Calculate pass/fail percentages, runs without results keep the 0.0% defaults
+        if total:
+            passed_percentage = results['passed_testcases'] * 100.0 / total
+            results['passed_percentage'] = f'{passed_percentage:.1f}%'
+            results['failed_percentage'] = f'{100.0 - passed_percentage:.1f}%'
 
         return results
 
@@ -157,18 +257,16 @@ class TestRunnerUtils:
         :rtype: String
         """
 
-        result = ''
-        # Extract hours component (floor division)
-        if test_run_time // 3600 > 0:
-            result += '{}h '.format(int(test_run_time // 3600))
-        # Remove hours from remaining time
-        test_run_time %= 3600
-        # Extract minutes component
-        if test_run_time // 60 > 0:
-            result += '{}m '.format(int(test_run_time // 60))
-        # Remove minutes from remaining time
-        test_run_time %= 60
-        # Append remaining seconds
-        result += '{}s'.format(int(test_run_time))
-
-        return result
+        # Split duration into hours, minutes and seconds components
+        hours, remainder = divmod(int(test_run_time), 3600)
+        minutes, seconds = divmod(remainder, 60)
+
+        parts = []
+        if hours:
+            parts.append(f'{hours}h')
+        if minutes:
+            parts.append(f'{minutes}m')
+        # Seconds are always displayed
+        parts.append(f'{seconds}s')
+
+        return ' '.join(parts)
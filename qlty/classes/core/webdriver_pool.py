@@ -0,0 +1,162 @@
+# Native libraries
+import atexit
+import queue
+import threading
+# Third party libraries
+from selenium.common.exceptions import WebDriverException
+# Project libraries
+from qlty.utilities.selenium_utils import create_driver, invalidate_window_size
+from qlty.utilities.utils import setup_logger
+import settings
+import qlty.config as config
+
+# Configure logging instance
+logger = setup_logger(__name__, settings.DEBUG_LEVEL)
+#: Session capabilities identifying the application under test, Android package or iOS bundle identifier
+_APP_ID_CAPABILITIES = ('appPackage', 'appium:appPackage', 'bundleId', 'appium:bundleId')
+#: Seconds to wait for a pooled driver to be released, defaults to 300 seconds when not configured in settings.py
+_ACQUIRE_TIMEOUT = settings.SELENIUM.get('POOL_ACQUIRE_TIMEOUT', 300)
+
+
+class WebDriverPool:
+    """
+    Process-level pool of reusable webdriver sessions
+    Sessions are created lazily up to :code:`config.POOL_SIZE` per platform and handed out
+    to test cases instead of creating and terminating a session for every test
+    """
+
+    def __init__(self):
+        """
+        Initialize empty pool, sessions are created on demand
+        """
+        #: Idle driver queues keyed by platform identifier
+        self._idle = {}
+        #: Number of sessions created per platform identifier
+        self._created = {}
+        #: Platform identifier for each driver owned by the pool, keyed by driver id
+        self._owned = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, test_case, platform):
+        """
+        Checks out a driver for the given platform, creating a new session if the pool has
+        not reached :code:`config.POOL_SIZE`, otherwise waits up to :code:`_ACQUIRE_TIMEOUT` seconds
+        for a driver to be released
+
+        :param test_case: A QLTY test case used for session metadata on creation
+        :type test_case: QLTYTestCase
+        :param platform: Platform identifier string for webdriver selection
+        :type platform: str
+        :return: Driver instance ready for use
+        :rtype: WebDriver
+        :raises RuntimeError: If no driver is released within :code:`_ACQUIRE_TIMEOUT` seconds
+        """
+        with self._lock:
+            idle = self._idle.setdefault(platform, queue.LifoQueue())
+            create_session = idle.empty() and self._created.get(platform, 0) < config.POOL_SIZE
+            if create_session:
+                # Reserve the slot before creating the session outside of the lock
+                self._created[platform] = self._created.get(platform, 0) + 1
+
+        if not create_session:
+            try:
+                driver = idle.get(timeout=_ACQUIRE_TIMEOUT)
+            except queue.Empty:
+                raise RuntimeError('No pooled driver was released within {} seconds'.format(_ACQUIRE_TIMEOUT))
+            logger.debug('Reusing pooled driver: session_id[{}]'.format(driver.session_id))
+            return driver
+
+        try:
+            driver = create_driver(test_case, platform)
+        except Exception:
+            # Free the reserved slot so another test case can retry
+            with self._lock:
+                self._created[platform] -= 1
+            raise
+        with self._lock:
+            self._owned[id(driver)] = platform
+        logger.debug('Created pooled driver: session_id[{}]'.format(driver.session_id))
+        return driver
+
+    def owns(self, driver):
+        """
+        Checks whether the driver was created by this pool
+
+        :param driver: Driver instance to verify
+        :type driver: WebDriver
+        :return: True if the driver belongs to the pool, False otherwise
+        :rtype: bool
+        """
+        return id(driver) in self._owned
+
+    def release(self, driver):
+        """
+        Verifies the session is alive, clears session state and returns the driver to the pool
+        Browser sessions have their cookies deleted, native apps are terminated and activated again so the
+        next test case starts from the launch screen
+        Drivers whose session ended or cannot be reset are terminated and their slot is freed
+
+        :param driver: Driver instance previously returned by :code:`acquire`
+        :type driver: WebDriver
+        """
+        platform = self._owned.get(id(driver))
+        if platform is None:
+            # Driver was already discarded
+            return
+        if driver.session_id is None:
+            logger.warning('Pooled driver session has ended, freeing its slot')
+            self.discard(driver)
+            return
+        try:
+            if config.MOBILE_BROWSER or config.DESKTOP_BROWSER:
+                # Only browser sessions hold cookies, clearing them also verifies the session
+                driver.delete_all_cookies()
+            else:
+                app_id = next((driver.capabilities[name] for name in _APP_ID_CAPABILITIES
+                               if driver.capabilities.get(name)), None)
+                if app_id is None:
+                    logger.warning('Pooled driver has no appPackage or bundleId capability to reset the app, '
+                                   'terminating session')
+                    self.discard(driver)
+                    return
+                # Restart the app under test, also verifies the session
+                driver.terminate_app(app_id)
+                driver.activate_app(app_id)
+        except WebDriverException as error:
+            logger.warning('Pooled driver could not be reset, terminating session\nError: {}'.format(error))
+            self.discard(driver)
+            return
+        self._idle[platform].put(driver)
+
+    def discard(self, driver):
+        """
+        Terminates a pooled driver and frees its slot
+
+        :param driver: Driver instance owned by the pool
+        :type driver: WebDriver
+        """
+        with self._lock:
+            platform = self._owned.pop(id(driver))
+            self._created[platform] -= 1
+        invalidate_window_size(driver)
+        try:
+            driver.quit()
+        except WebDriverException as error:
+            logger.warning('Pooled driver session could not be terminated\nError: {}'.format(error))
+
+    def drain(self):
+        """
+        Terminates every idle driver in the pool, invoked on interpreter shutdown
+        """
+        for idle in self._idle.values():
+            while True:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+                self.discard(driver)
+
+
+#: Shared pool instance for the current process
+driver_pool = WebDriverPool()
+atexit.register(driver_pool.drain)
@@ -1,3 +1,5 @@
+# Native libraries
+import itertools
 # Third party libraries
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
@@ -27,7 +29,7 @@ class SaucelabsHelper:
         """
         logger.info('Configuring appium webdriver for saucelabs remote execution')
         try:
-            capabilities = settings.SELENIUM['CAPABILITIES'][platform + '_saucelabs']
+            base_capabilities = settings.SELENIUM['CAPABILITIES'][platform + '_saucelabs']
         except KeyError:
             logger.error('Saucelabs driver requested for {} but no capabilities defined '
                          'in settings.py\nPlease configure the required capabilities')
@@ -45,10 +47,8 @@ class SaucelabsHelper:
             'name': testcase_name,
             'build': settings.PROJECT_CONFIG['RELEASE'],
         }
-        # Merge with saucelabs capabilities
-        capabilities.update(settings.SELENIUM['CAPABILITIES'][platform + '_saucelabs'])
-        # Add test-specific options for individual test reporting
-        capabilities['sauce:options'] = sauce_options
+        # Copy saucelabs capabilities adding test-specific options for individual test reporting
+        capabilities = {**base_capabilities, 'sauce:options': sauce_options}
         # Construct remote appium webdriver URL
         # Configure sauce labs remote URL
         appium_remote = 'https://{}:{}@{}'.format(settings.SAUCELABS['USERNAME'],
@@ -58,6 +58,21 @@ class SaucelabsHelper:
         options.load_capabilities(capabilities)
         return webdriver.Remote(command_executor=appium_remote, options=options)
 
+    @staticmethod
+    def bookmark_result(test_case):
+        """
+        Records the size of the shared run result error and failure lists before the test case
+        executes so :code:`post_result` only inspects entries added by this test case
+
+        :param test_case: A QLTY test case being set up
+        :type test_case: QLTYTestCase
+        """
+        if test_case._outcome is None:
+            # Test case executed through debug(), no run result available
+            return
+        result = test_case._outcome.result
+        test_case.result_offsets = (len(result.errors), len(result.failures))
+
     @staticmethod
     def post_result(test_case, driver):
         """
@@ -73,11 +88,17 @@ class SaucelabsHelper:
             # Python 3.4 through 3.10 compatibility
             result = test_case.defaultTestResult()
             test_case._feedErrorsToResult(result, test_case._outcome.errors)
+            errors, failures = result.errors, result.failures
         else:
             # Python 3.11 and later compatibility
             result = test_case._outcome.result
+            # Shared run result holds every prior test case, skip entries recorded before setUp
+            error_offset, failure_offset = test_case.result_offsets
+            errors, failures = result.errors[error_offset:], result.failures[failure_offset:]
 
-        job_result = 'passed' if all(test != test_case for test, text in result.errors + result.failures) else 'failed'
+        # Identity check avoids TestCase.__eq__, chain avoids copying both lists into a new one
+        job_result = 'passed' if all(test is not test_case
+                                     for test, text in itertools.chain(errors, failures)) else 'failed'
         logger.debug('Test case: {} has status [{}]'.format(test_case_name, job_result))
         # Submit result to Saucelabs test case record
         driver.execute_script("sauce:job-result={}".format(job_result))
@@ -1,5 +1,8 @@
 # Native libraries
+import copy
+import functools
 import os
+import ssl
 import requests
 from pprint import pformat
 import urllib.parse
@@ -15,17 +18,189 @@ import settings
 # Initialize the logger
 logger = setup_logger(__name__, settings.DEBUG_LEVEL)
 
+#: Slack emoji for each supported platform
+_PLATFORM_EMOJI = {
+    'android': ':android:',
+    'android_web': ':android::chrome:',
+    'ios': ':apple-neon:',
+    'ios_web': ':apple-logo::safari:',
+}
+
+#: Summary blocks layout, text placeholders are filled in for every report
+_PAYLOAD_TEMPLATE = (
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "Q3 Summary - Mobile - {build_id}",
+        }
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "Platform:\t{platform}"
+            },
+            {
+                "type": "mrkdwn",
+                "text": "Release:\t{release}"
+            },
+            {
+                "type": "mrkdwn",
+                "text": "Environment:\t{environment}"
+            },
+            {
+                "type": "mrkdwn",
+                "text": "Run time:\t{run_time}"
+            }
+        ]
+    },
+    {
+        "type": "divider"
+    },
+    {
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": "{results_summary}"
+            }
+        ]
+    },
+)
+
+#: Footer blocks appended to every payload
+_PAYLOAD_FOOTER = (
+    {
+        "type": "divider"
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": ":qlty-framework: Powered by *QLTY Mobile Test Automation* | v 1.0.0"
+            }
+        ]
+    },
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_client():
+    """
+    Creates the process-wide Slack client on first use so reporting-disabled runs never construct it
+
+    :return: Slack web client
+    :rtype: WebClient
+    """
+    # Reuse one SSL context for every request instead of loading CA certificates per connection
+    return WebClient(token=settings.SLACK['SLACK_AUTH_TOKEN'], ssl=ssl.create_default_context())
+
+
+def _render_blocks(template, fields):
+    """
+    Copies a block template filling text placeholders with the given fields
+
+    :param template: Block kit structure containing :code:`{placeholder}` strings
+    :param fields: Values for each placeholder
+    :type fields: dict
+    :return: Rendered copy of the template, sequences are returned as lists
+    """
+    if isinstance(template, dict):
+        return {key: _render_blocks(value, fields) for key, value in template.items()}
+    if isinstance(template, (list, tuple)):
+        return [_render_blocks(value, fields) for value in template]
+    if isinstance(template, str):
+        return template.format_map(fields)
+    return template
+
+
+def _get_jenkins_url(platform, build_number):
+    """
+    Builds the complete Jenkins job URL for the given platform
+
+    :param platform: Platform identifier of the current run
+    :type platform: str
+    :param build_number: Jenkins build number for the current run
+    :type build_number: str
+    :return: Jenkins build URL
+    :rtype: str
+    """
+    job_url_template = config.JENKINS['INDUSTRIES_URL'] + config.JENKINS['QLTY_JOBS_URL']
+    return (job_url_template + build_number).replace(
+        '{CURRENT_PLATFORM}', settings.JENKINS['JOBS'][platform])
+
+
+@functools.lru_cache(maxsize=1)
+def _get_button_blocks(platform, saucelabs_integration, running_on_jenkins, build_number):
+    """
+    Generates action button blocks for Slack message based on
+    active integration configurations
+
+    :param platform: Platform identifier of the current run
+    :type platform: str
+    :param saucelabs_integration: Whether the run executed on Saucelabs
+    :type saucelabs_integration: bool
+    :param running_on_jenkins: Whether the run executed on Jenkins
+    :type running_on_jenkins: bool
+    :param build_number: Jenkins build number for the current run
+    :type build_number: str
+    :return: JSON payload with integration action buttons
+    :rtype: Dictionary
+    """
+    actions = {
+        'type': 'actions',
+        'elements': []
+    }
+
+    # Include Saucelabs button if running on saucelabs
+    if saucelabs_integration:
+        actions['elements'].append(
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "Saucelabs",
+                },
+                "url": "https://app.saucelabs.com/dashboard/tests/rdc",
+                "action_id": "qlty-saucelabs"
+            }
+        )
+    # Include Jenkins button if running on jenkins
+    if running_on_jenkins:
+        actions['elements'].append(
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "Jenkins",
+                },
+                "url": _get_jenkins_url(platform, build_number or ''),
+                "action_id": "qlty-jenkins"
+            }
+        )
+
+    # Only return payload if buttons were added
+    if len(actions['elements']) > 0:
+        return actions
+
 
 class SlackReporter:
     """
     Provides automated Slack channel messaging capabilities for test result reporting
     """
 
-    def __init__(self):
+    @functools.cached_property
+    def client(self):
         """
-        Initialize the reporter with Slack client
+        Slack client shared across reporter instances, created on first use
+
+        :return: Slack web client
+        :rtype: WebClient
         """
-        self.client = WebClient(token=settings.SLACK['SLACK_AUTH_TOKEN'])
+        return _get_shared_client()
 
     def report(self, results, run_time):
         """
@@ -37,6 +212,11 @@ class SlackReporter:
         :type: String
         :return: None
         """
+        # Skip building the payload when the message could never be posted
+        if not settings.SLACK.get('SLACK_AUTH_TOKEN'):
+            logger.warning('No Slack authentication token configured, skipping slack notification')
+            return {}
+
         # Calculate test run statistics for Slack publication
         if results['failed_testcases'] > 0:
             if not config.REPORT_ON_FAIL:
@@ -69,125 +249,31 @@ class SlackReporter:
             results_summary += '{}:ci-fail:{}*{}* ({})'.format(spaces, spaces, results['failed_testcases'],
                                                                results['failed_percentage'])
 
-        # Build initial payload structure
+        fields = {
+            'build_id': get_unique_build_id(),
+            'platform': self._get_platform_emoji(),
+            'release': settings.PROJECT_CONFIG['RELEASE'],
+            'environment': settings.PROJECT_CONFIG['ENVIRONMENT'],
+            'run_time': run_time,
+            'results_summary': results_summary,
+        }
+        # Build payload from the summary template
         payload = {
             # "channel": settings.SLACK['CHANNEL'],
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Q3 Summary - Mobile - {}".format(get_unique_build_id()),
-                    }
-                },
-                {
-                    "type": "context",
-                    "elements": [
-                        {
-                            "type": "mrkdwn",
-                            "text": "Platform:\t{}".format(self._get_platform_emoji())
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": "Release:\t{}".format(settings.PROJECT_CONFIG['RELEASE'])
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": "Environment:\t{}".format(settings.PROJECT_CONFIG['ENVIRONMENT'])
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": "Run time:\t{}".format(run_time)
-                        }
-                    ]
-                },
-                {
-                    "type": "divider"
-                },
-                {
-                    "type": "section",
-                    "fields": [
-                        {
-                            "type": "mrkdwn",
-                            "text": results_summary
-                        }
-                    ]
-                },
-                ]
+            "blocks": _render_blocks(_PAYLOAD_TEMPLATE, fields)
         }
         # Include action buttons
-        actions = self._get_button_blocks()
-        # Append blocks if integrations are available
+        actions = _get_button_blocks(config.CURRENT_PLATFORM, config.SAUCELABS_INTEGRATION,
+                                     config.RUNNING_ON_JENKINS, os.getenv('BUILD_NUMBER'))
+        # Append blocks if integrations are available, copied so the cached blocks are never mutated
         if actions:
-            payload['blocks'].append(actions)
+            payload['blocks'].append(copy.deepcopy(actions))
 
         # Build payload footer
-        payload['blocks'].append(
-            {
-                "type": "divider"
-            })
-        payload['blocks'].append(
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": ":qlty-framework: Powered by *QLTY Mobile Test Automation* | v 1.0.0"
-                    }
-                ]
-            })
+        payload['blocks'].extend(_render_blocks(_PAYLOAD_FOOTER, fields))
 
         return payload
 
-    def _get_button_blocks(self):
-        """
-        Generates action button blocks for Slack message based on
-        active integration configurations
-
-        :return: JSON payload with integration action buttons
-        :rtype: Dictionary
-        """
-        actions = {
-            'type': 'actions',
-            'elements': []
-        }
-
-        # Include Saucelabs button if running on saucelabs
-        if config.SAUCELABS_INTEGRATION:
-            actions['elements'].append(
-                {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Saucelabs",
-                    },
-                    "url": "https://app.saucelabs.com/dashboard/tests/rdc",
-                    "action_id": "qlty-saucelabs"
-                }
-            )
-        # Include Jenkins button if running on jenkins
-        if config.RUNNING_ON_JENKINS:
-            # Build complete jenkins URL for current platform
-            jenkins_url = '{}{}{}'.format(config.JENKINS['INDUSTRIES_URL'], config.JENKINS['QLTY_JOBS_URL'],
-                                          os.getenv('BUILD_NUMBER')).replace(
-                '{CURRENT_PLATFORM}', settings.JENKINS['JOBS'][config.CURRENT_PLATFORM])
-
-            actions['elements'].append(
-                {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Jenkins",
-                    },
-                    "url": jenkins_url,
-                    "action_id": "qlty-jenkins"
-                }
-            )
-
-        # Only return payload if buttons were added
-        if len(actions['elements']) > 0:
-            return actions
-
     def _get_platform_emoji(self):
         """
         Returns the appropriate emoji representing the current platform configuration
@@ -195,16 +281,10 @@ class SlackReporter:
         :return: Platform emoji string
         :rtype: String
         """
-        if config.CURRENT_PLATFORM == 'android':
-            return ':android:'
-        elif config.CURRENT_PLATFORM == 'android_web':
-            return ':android::chrome:'
-        elif config.CURRENT_PLATFORM == 'ios':
-            return ':apple-neon:'
-        elif config.CURRENT_PLATFORM == 'ios_web':
-            return ':apple-logo::safari:'
-        else:
+        emoji = _PLATFORM_EMOJI.get(config.CURRENT_PLATFORM)
+        if emoji is None:
             logger.warning('No icon defined for platform: {}'.format(config.CURRENT_PLATFORM))
+        return emoji
 
     def _post_results(self, payload):
         """
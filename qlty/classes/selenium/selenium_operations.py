@@ -1,19 +1,127 @@
 # Native libraries
+import functools
+import queue
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 # Third party libraries
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as conditions
-from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.by import By
-import numpy
+from appium.webdriver.common.appiumby import AppiumBy
 # Project libraries
 import settings
 import qlty.config as config
 from qlty.utilities.utils import setup_logger
 from qlty.utilities.utils import ANDROID_SWIPE_OFFSETS
+from qlty.utilities.selenium_utils import get_window_size, invalidate_window_size
 
 logger = setup_logger(__name__, settings.DEBUG_LEVEL)
 
+#: Default wait timeout in seconds for element operations
+_TIMEOUT = settings.SELENIUM['TIMEOUT']
+#: Seconds to wait for gesture animations, defaults to 1 second when not configured in settings.py
+_STEP_TIME = settings.SELENIUM.get('STEP_TIME', 1)
+#: Seconds between screen samples while waiting for a gesture animation to settle
+_ANIMATION_POLL_INTERVAL = 0.05
+
+#: Element properties supported by :code:`SeleniumOperations.read_many`
+READ_MANY_FIELDS = ('text', 'value', 'enabled', 'visible')
+#: Locator strategies supported by :code:`SeleniumOperations.read_many`
+READ_MANY_STRATEGIES = (By.CSS_SELECTOR, By.XPATH, By.ID, By.NAME, By.TAG_NAME, By.CLASS_NAME)
+#: Element property readers used by :code:`SeleniumOperations.gather` based reads
+ELEMENT_READERS = {
+    'text': lambda element: element.text,
+    'value': lambda element: element.get_attribute('value'),
+    'enabled': lambda element: element.is_enabled(),
+    'visible': lambda element: element.is_displayed(),
+}
+# Matches xpath locators selecting an Android widget class by resource id only
+_ANDROID_RESOURCE_ID_XPATH = re.compile(r'^//(android\.[\w.]+)\[@resource-id=(["\'])([^"\']+)\2\]$')
+# Locates the first element for each locator and reads the requested fields in a single round-trip
+_READ_MANY_SCRIPT = """
+var locators = arguments[0], fields = arguments[1];
+function find(by, value) {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(value, document, null,
+                                               XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+    }
+    return null;
+}
+function read(element, field) {
+    switch (field) {
+        case 'text': return element.innerText;
+        case 'value': return element.value === undefined ? null : String(element.value);
+        case 'enabled': return !element.disabled;
+        case 'visible': return element.getClientRects().length > 0;
+    }
+    return null;
+}
+return locators.map(function (locator) {
+    var element = find(locator[0], locator[1]);
+    return element === null ? null : fields.map(function (field) { return read(element, field); });
+});
+"""
+
+
+def _uiselector_string(value):
+    """
+    Escapes a value for use as a string argument inside a UiSelector expression
+
+    :param value: Raw string value
+    :type value: str
+    :return: Escaped string value
+    :rtype: str
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _prefer_native_locator(locator):
+    """
+    Rewrites Android xpath locators of the form :code:`//android.widget.Button[@resource-id="id"]` into
+    the equivalent UiAutomator selector. UiAutomator2 evaluates xpath by serializing the whole view
+    hierarchy on every lookup, while UiSelector queries are resolved natively.
+    Other locators are returned unchanged.
+
+    :param locator: Tuple containing locator strategy and value
+    :type locator: tuple
+    :return: Tuple containing locator strategy and value
+    :rtype: tuple
+    """
+    if config.CURRENT_PLATFORM != 'android' or locator[0] != By.XPATH:
+        return locator
+    match = _ANDROID_RESOURCE_ID_XPATH.match(locator[1])
+    if match is None:
+        return locator
+    return (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("{}").resourceId("{}")'.format(
+        match.group(1), _uiselector_string(match.group(3))))
+
+
+@functools.lru_cache(maxsize=256)
+def cached_locator(by, template, *args):
+    """
+    Builds a parameterized locator, memoizing the result for repeated arguments, for example:
+
+        .. code-block:: python
+
+            cached_locator(AppiumBy.ACCESSIBILITY_ID, 'row_{}', 3)
+
+    :param by: Locator strategy
+    :type by: str
+    :param template: Selector template using :code:`str.format` placeholders
+    :type template: str
+    :param args: Hashable values substituted into the template
+    :return: Tuple containing locator strategy and value
+    :rtype: tuple
+    """
+    return by, template.format(*args)
+
 
 class SeleniumOperations:
     #: Driver reference for web automation
@@ -27,8 +135,24 @@ class SeleniumOperations:
         :type driver: WebDriver
         """
         self.driver = driver
+        # Waits hold no state between calls, a single instance serves every default-timeout wait
+        self._wait = WebDriverWait(driver, _TIMEOUT, ignored_exceptions=(StaleElementReferenceException,))
 
-    def get_element(self, locator, timeout=settings.SELENIUM['TIMEOUT']):
+    def _get_wait(self, timeout=_TIMEOUT):
+        """
+        Returns a wait that ignores stale element and missing element exceptions, reusing the
+        cached instance for the default timeout
+
+        :param timeout: Maximum wait time in seconds
+        :type timeout: int
+        :return: Wait bound to this instance's driver
+        :rtype: WebDriverWait
+        """
+        if timeout == _TIMEOUT:
+            return self._wait
+        return WebDriverWait(self.driver, timeout, ignored_exceptions=(StaleElementReferenceException,))
+
+    def get_element(self, locator, timeout=_TIMEOUT):
         """
         Locates and returns a web element after confirming its presence in the DOM
 
@@ -36,7 +160,7 @@ class SeleniumOperations:
 
             .. code-block:: python
 
-                (By.XPATH, '//android.widget.Button[@resource-id="oaapprove"]')
+                (AppiumBy.ID, 'oaapprove')
 
         :type locator: tuple
         :param timeout: Maximum wait time in seconds before raising an exception, defaults to :code:`settings.SELENIUM['TIMEOUT']`
@@ -44,8 +168,8 @@ class SeleniumOperations:
         :return: Located web element
         :rtype: WebElement
         """
-        WebDriverWait(self.driver, timeout,
-                      ignored_exceptions=StaleElementReferenceException).until(
+        locator = _prefer_native_locator(locator)
+        self._get_wait(timeout).until(
             conditions.presence_of_element_located([locator[0], locator[1]]),
             message='Element could not be found using the specified criteria:\nStrategy:{}\nSelector:{}'.format(
                 locator[0], locator[1]))
@@ -60,13 +184,14 @@ class SeleniumOperations:
 
             .. code-block:: python
 
-                (By.XPATH, '//android.widget.Button[@resource-id="oaapprove"]')
+                (AppiumBy.ID, 'oaapprove')
 
         :type locator: tuple
         :return: Collection of matching web elements
         :rtype: list
         """
-        WebDriverWait(self.driver, settings.SELENIUM['TIMEOUT']).until(
+        locator = _prefer_native_locator(locator)
+        self._wait.until(
             conditions.presence_of_all_elements_located([locator[0], locator[1]]),
             message='No matching elements found using the specified criteria:\nStrategy:{}\nSelector:{}'.format(
                 locator[0], locator[1]))
@@ -81,20 +206,19 @@ class SeleniumOperations:
 
             .. code-block:: python
 
-                (By.XPATH, '//android.widget.Button[@resource-id="oaapprove"]')
+                (AppiumBy.ID, 'oaapprove')
 
         :type locator: tuple
         :param text: Text content to search for within elements
         :type text: str
         :return: None
         """
-        return WebDriverWait(
-            self.driver, settings.SELENIUM['TIMEOUT'], ignored_exceptions=[StaleElementReferenceException]).until(
+        return self._wait.until(
             lambda x: self._text_to_be_present_in_elements(locator, text),
             message="No elements contained the specified text:\n Strategy:{}\n Selector:{}\nExpected Text:{}".format(
                 locator[0], locator[1], text))
 
-    def wait_for_element_to_not_be_visible(self, locator, timeout=settings.SELENIUM['TIMEOUT']):
+    def wait_for_element_to_not_be_visible(self, locator, timeout=_TIMEOUT):
         """
         Waits until the specified element is no longer visible in the viewport
 
@@ -102,13 +226,13 @@ class SeleniumOperations:
 
             .. code-block:: python
 
-                (By.XPATH, '//android.widget.Button[@resource-id="oaapprove"]')
+                (AppiumBy.ID, 'oaapprove')
 
         :type locator: tuple
         :param timeout: Maximum wait time in seconds before raising an exception, defaults to :code:`settings.SELENIUM['TIMEOUT']`
         :type timeout: int
         """
-        WebDriverWait(self.driver, timeout).until(
+        self._get_wait(timeout).until(
             conditions.invisibility_of_element([locator[0], locator[1]]),
             message='Element remained visible:\nStrategy:{}\nSelector:{}'.format(locator[0], locator[1]))
 
@@ -120,21 +244,83 @@ class SeleniumOperations:
 
             .. code-block:: python
 
-                (By.XPATH, '//android.widget.Button[@resource-id="oaapprove"]')
+                (AppiumBy.ID, 'oaapprove')
 
         :type locator: tuple
         :param text: Text content to search for within elements
         :type text: str
         """
-        try:
-            element_list = self.driver.find_elements(by=locator[0], value=locator[1])
-            elements_text = [element.text for element in element_list]
+        # Read element text one at a time so the search stops at the first match
+        for element in self.driver.find_elements(by=locator[0], value=locator[1]):
+            try:
+                if text in element.text:
+                    return element
+            except StaleElementReferenceException:
+                # Element was detached while searching, keep checking the remaining elements
+                continue
+        return False
 
-            for i, element in enumerate(elements_text):
-                if text in element:
-                    return element_list[i]
-        except StaleElementReferenceException:
-            return False
+    def read_many(self, locators, fields):
+        """
+        Reads properties of several elements with a single :code:`execute_script` round-trip instead of
+        one WebDriver command per element and property. Only available in browser and webview contexts.
+        Does not wait for elements, locators without a matching element return None.
+
+        :param locators: Collection of tuples containing locator strategy and value, for example:
+
+            .. code-block:: python
+
+                [(By.CSS_SELECTOR, '#username'), (By.XPATH, '//button[@type="submit"]')]
+
+        :type locators: list
+        :param fields: Properties to read from each element, any of :code:`READ_MANY_FIELDS`
+        :type fields: list
+        :return: One dictionary of field values per locator, or None when no element matched
+        :rtype: list
+        """
+        for field in fields:
+            if field not in READ_MANY_FIELDS:
+                raise RuntimeError('Unsupported field for batched read: {}'.format(field))
+        for locator in locators:
+            if locator[0] not in READ_MANY_STRATEGIES:
+                raise RuntimeError('Unsupported locator strategy for batched read: {}'.format(locator[0]))
+
+        values = self.driver.execute_script(
+            _READ_MANY_SCRIPT, [[locator[0], locator[1]] for locator in locators], list(fields))
+        return [None if element_values is None else dict(zip(fields, element_values))
+                for element_values in values]
+
+    def gather(self, functions, drivers=None):
+        """
+        Runs independent read-only functions concurrently, each one on its own webdriver session.
+        WebDriver sessions are NOT thread-safe: every worker checks out a distinct driver from
+        :code:`drivers`, which must be separate sessions displaying the same application state.
+        Runs serially on this instance's driver when fewer than two sessions are provided.
+
+        :param functions: Callables receiving a driver and returning the value read
+        :type functions: list
+        :param drivers: Independent webdriver sessions to distribute the functions across
+        :type drivers: list
+        :return: Values returned by each function, in the same order
+        :rtype: list
+        """
+        if not drivers or len(drivers) < 2:
+            return [function(self.driver) for function in functions]
+
+        available = queue.Queue()
+        for driver in drivers:
+            available.put(driver)
+
+        def run(function):
+            # Hold the driver exclusively for the duration of the call
+            driver = available.get()
+            try:
+                return function(driver)
+            finally:
+                available.put(driver)
+
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            return list(executor.map(run, functions))
 
     def try_fetch(self, function):
         """
@@ -150,22 +336,61 @@ class SeleniumOperations:
             logger.debug('try_fetch: Element was not found')
             return None
 
-    def swipe(self, offset=None):
+    def swipe(self, offset=None, locator=None):
         """
-        Executes a swipe gesture based on the provided offset parameters
+        Executes a swipe gesture based on the provided offset parameters and waits for the screen to settle
 
         :param offset: Dictionary specifying swipe coordinates with start_x, start_y, end_x, end_y values
             expressed as percentages (0-1) of viewport dimensions. For instance, start_y of 0.25 begins
-            the swipe at 25% of the viewport height
+            the swipe at 25% of the viewport height. iOS swipes take a dictionary with a direction instead
         :type offset: dict
+        :param locator: Optional element to watch while the swipe animation settles, without it the swipe
+            waits a fixed step time
+        :type locator: tuple
         """
-        if config.CURRENT_PLATFORM == 'ios':
+        platform = config.CURRENT_PLATFORM
+        if platform == 'ios':
             self._swipe_ios(offset)
+            # iOS swipes previously waited an extra second for the animation to finish
+            self._wait_for_animation(locator, _STEP_TIME + 1)
         else:
             self._swipe_android(offset)
-        # Wait for swipe animation to complete
-        import time
-        time.sleep(settings.SELENIUM['STEP_TIME'])
+            self._wait_for_animation(locator, _STEP_TIME)
+
+    def _wait_for_animation(self, locator=None, max_wait=_STEP_TIME):
+        """
+        Waits until the screen stops changing after a gesture, sampling the location of the given element
+        every :code:`_ANIMATION_POLL_INTERVAL` seconds. Returns as soon as two consecutive samples match,
+        or after max_wait seconds otherwise. Sleeps max_wait seconds when no locator is given, since
+        sampling the page source serializes the whole view hierarchy on every poll.
+
+        :param locator: Optional tuple containing locator strategy and value of the element to watch
+        :type locator: tuple
+        :param max_wait: Maximum wait time in seconds
+        :type max_wait: float
+        """
+        if locator is None:
+            time.sleep(max_wait)
+            return
+
+        def sample():
+            try:
+                return self.driver.find_element(locator[0], locator[1]).location
+            except WebDriverException:
+                # Element not available yet, treat as still changing
+                return None
+
+        deadline = time.monotonic() + max_wait
+        previous = sample()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(_ANIMATION_POLL_INTERVAL, remaining))
+            current = sample()
+            if current is not None and current == previous:
+                return
+            previous = current
 
     def _swipe_android(self, offset):
         """
@@ -176,24 +401,32 @@ class SeleniumOperations:
             the swipe at 25% of the viewport height
         :type offset: dict
         """
+        start_x, start_y, end_x, end_y = offset['start_x'], offset['start_y'], offset['end_x'], offset['end_y']
+        driver = self.driver
         # Calculate pixel boundaries for the viewport
-        viewport = self.driver.get_window_size()
+        viewport = get_window_size(driver)
+        width, height = viewport['width'], viewport['height']
         min_height = 1
-        max_height = viewport['height'] - 1
+        max_height = height - 1
         min_width = 1
-        max_width = viewport['width'] - 1
+        max_width = width - 1
 
         # Constrain coordinates to ensure they remain within viewport bounds
-        coordinates = {
-            'start_x': int(numpy.clip(viewport['width'] * offset['start_x'], min_width, max_width)),
-            'start_y': int(numpy.clip(viewport['height'] * offset['start_y'], min_height, max_height)),
-            'end_x': int(numpy.clip(viewport['width'] * offset['end_x'], min_width, max_width)),
-            'end_y': int(numpy.clip(viewport['height'] * offset['end_y'], min_height, max_height))
-        }
+        coordinates = (
+            int(max(min_width, min(width * start_x, max_width))),
+            int(max(min_height, min(height * start_y, max_height))),
+            int(max(min_width, min(width * end_x, max_width))),
+            int(max(min_height, min(height * end_y, max_height))))
 
-        self.driver.swipe(coordinates['start_x'], coordinates['start_y'],
-                          coordinates['end_x'], coordinates['end_y'])
-        logger.debug('Executing swipe with coordinates {}'.format(coordinates))
+        driver.swipe(*coordinates)
+        logger.debug('Executing swipe with coordinates %s', coordinates)
+
+    def invalidate_viewport(self):
+        """
+        Discards the cached viewport size of this instance's driver, call after rotating the device or resizing
+        the window. Shares the cache cleared by :code:`selenium_utils.invalidate_window_size`
+        """
+        invalidate_window_size(self.driver)
 
     def _swipe_ios(self, offset):
         """
@@ -206,10 +439,8 @@ class SeleniumOperations:
         """
         direction = offset['direction']
         self.driver.execute_script('mobile: swipe', {'direction': direction})
-        # Allow animation to finish
-        time.sleep(1)
 
-    def wait_for(self, method, expected_result, timeout=settings.SELENIUM['TIMEOUT']):
+    def wait_for(self, method, expected_result, timeout=_TIMEOUT):
         """
         Continuously evaluates the provided method until its result matches the expected value.
 
@@ -221,8 +452,7 @@ class SeleniumOperations:
         :type timeout: Int
         :return:
         """
-        return WebDriverWait(self.driver, timeout,
-                             ignored_exceptions=StaleElementReferenceException).until(
+        return self._get_wait(timeout).until(
             lambda x: method() == expected_result,
             message="Method result never matched the expected value")
 
@@ -292,8 +522,8 @@ class SeleniumOperations:
         :param locator: Tuple containing locator strategy and value
         :type locator: tuple
         """
-        WebDriverWait(self.driver, timeout=settings.SELENIUM['TIMEOUT'],
-                      ignored_exceptions=[StaleElementReferenceException, NoSuchElementException]).until(
+        # NoSuchElementException is always ignored by WebDriverWait
+        self._wait.until(
             lambda x: self._bool_click(self.get_element(locator)))
 
     def _bool_click(self, element):
@@ -307,45 +537,50 @@ class SeleniumOperations:
         try:
             element.click()
             return True
-        except:
+        except WebDriverException as error:
+            # Covers intercepted, not interactable and stale elements, other errors propagate
+            logger.debug('Click attempt failed with %s, retrying', error.__class__.__name__)
             return False
 
-    def browser_tap(self, locator, timeout=settings.SELENIUM['TIMEOUT']):
+    def browser_tap(self, locator, timeout=_TIMEOUT):
         """
         Performs a tap action on an element in mobile browser context
         :param locator: Tuple containing By strategy and selector string, for example:
 
         .. code-block:: python
 
-            (By.XPATH, '//android.widget.Button[@resource-id="oaapprove"]')
+            (By.CSS_SELECTOR, '#approve')
 
         :type locator: tuple
         :param timeout: Maximum wait time in seconds before raising an exception, defaults to :code:`settings.SELENIUM['TIMEOUT']`
         :type timeout: int
         """
-        # Wait for element to become interactable
-        WebDriverWait(self.driver, timeout,
-                      ignored_exceptions=StaleElementReferenceException).until(
-            conditions.element_to_be_clickable([locator[0], locator[1]]),
+        platform = config.CURRENT_PLATFORM
+        if platform not in ('ios_web', 'android_web'):
+            raise RuntimeError('Browser tap is only supported for mobile browser automation')
+
+        # Wait for element to become interactable, the condition returns the located element
+        element = self._get_wait(timeout).until(
+            conditions.element_to_be_clickable((locator[0], locator[1])),
             message='Element never became clickable:\nStrategy:{}\nSelector:{}'.format(
                 locator[0], locator[1]))
 
-        if config.CURRENT_PLATFORM == 'ios_web':
-            self.driver.execute_script("arguments[0].click();", self.get_element(locator, timeout))
-        elif config.CURRENT_PLATFORM == 'android_web':
-            self.get_element(locator, timeout).click()
+        if platform == 'ios_web':
+            self.driver.execute_script("arguments[0].click();", element)
         else:
-            raise RuntimeError('Browser tap is only supported for mobile browser automation')
+            element.click()
 
     def tap_android_button(self, button_text):
         """
         Clicks an Android button based on its text content
-        Uses xpath expression: :code:`//android.widget.Button[@text="{BUTTON_TEXT}"]`
+        Uses UiAutomator expression: :code:`new UiSelector().className("android.widget.Button").text("{BUTTON_TEXT}")`
         Note: When multiple buttons share the same text, only the first match will be clicked
 
         :param button_text: Text displayed on the button
         """
-        self.get_element((By.XPATH, '//android.widget.Button[@text="{}"]'.format(button_text))).click()
+        self.get_element(cached_locator(AppiumBy.ANDROID_UIAUTOMATOR,
+                                        'new UiSelector().className("android.widget.Button").text("{}")',
+                                        _uiselector_string(button_text))).click()
 
     def swipe_until_visible(self, locator, attempts=3):
         """
@@ -359,16 +594,16 @@ class SeleniumOperations:
         :return: Located web element
         :rtype: WebElement
         """
+        locator = _prefer_native_locator(locator)
         while attempts > 0:
-            try:
-                element = self.driver.find_element(locator[0], locator[1])
-                logger.debug('[{}][{}] Element located after swipe operation'.format(locator[0], locator[1]))
-                return element
-            except NoSuchElementException:
-                logger.debug('Element not found, executing downward swipe')
-                self.swipe(ANDROID_SWIPE_OFFSETS['down'])
-                # Wait for swipe animation to complete
-                time.sleep(settings.SELENIUM['STEP_TIME'])
+            # Probe with find_elements, an empty result avoids a server-side NoSuchElement error
+            elements = self.driver.find_elements(locator[0], locator[1])
+            if elements:
+                logger.debug('[%s][%s] Element located after swipe operation', locator[0], locator[1])
+                return elements[0]
+            logger.debug('Element not found, executing downward swipe')
+            # Swipe returns once the animation has settled
+            self.swipe(ANDROID_SWIPE_OFFSETS['down'])
             attempts -= 1
         raise NoSuchElementException('Element could not be found using locator {} '
                                      'after performing swipe operations'.format(locator))
@@ -1,14 +1,16 @@
 # Third party libraries
 from selenium.common.exceptions import StaleElementReferenceException
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as conditions
 # Project libraries
 import settings
-from qlty.classes.selenium.selenium_operations import SeleniumOperations
+from qlty.classes.selenium.selenium_operations import SeleniumOperations, ELEMENT_READERS
 from qlty.utilities.utils import setup_logger
 
 logger = setup_logger(__name__, settings.DEBUG_LEVEL)
 
+#: Default wait timeout in seconds for element operations
+_TIMEOUT = settings.SELENIUM['TIMEOUT']
+
 
 class WebElementOperations(SeleniumOperations):
     """
@@ -25,6 +27,22 @@ class WebElementOperations(SeleniumOperations):
         """
         super(WebElementOperations, self).__init__(driver)
         self.controller = controller
+        #: Resolved locator tuples keyed by locator key
+        self._locator_cache = {}
+
+    def _resolve(self, locator_key):
+        """
+        Returns the locator tuple for locator_key, resolving it from the controller only once
+
+        :param locator_key: Dictionary key for the locators collection
+        :type locator_key: str
+        :return: Tuple containing locator strategy and value
+        :rtype: tuple
+        """
+        locator = self._locator_cache.get(locator_key)
+        if locator is None:
+            locator = self._locator_cache[locator_key] = self.controller.LOCATORS[locator_key]
+        return locator
 
     def op_click_element(self, locator_key):
         """
@@ -34,20 +52,19 @@ class WebElementOperations(SeleniumOperations):
         :type locator_key: str
         :return:
         """
+        locator = self._resolve(locator_key)
         try:
             # Verify element is ready for interaction
-            WebDriverWait(self.driver, settings.SELENIUM['TIMEOUT'],
-                          ignored_exceptions=StaleElementReferenceException).until(
-                conditions.element_to_be_clickable(self.controller.LOCATORS[locator_key]),
+            self._wait.until(
+                conditions.element_to_be_clickable(locator),
                 message='Element never became clickable:\nStrategy:{}\nSelector:{}'.format(
-                    self.controller.LOCATORS[locator_key][0], self.controller.LOCATORS[locator_key][1]))
-            logger.debug('Element [{}] is ready for interaction, performing click'.format(
-                self.controller.LOCATORS[locator_key][1]))
-            self.controller.get_element(self.controller.LOCATORS[locator_key]).click()
+                    locator[0], locator[1]))
+            logger.debug('Element [%s] is ready for interaction, performing click', locator[1])
+            self.controller.get_element(locator).click()
         except StaleElementReferenceException:
             # Element may have changed between retrieval and click, re-fetch and retry
             logger.debug('Stale element detected during click, re-fetching element')
-            self.controller.get_element(self.controller.LOCATORS[locator_key]).click()
+            self.controller.get_element(locator).click()
 
     def op_get_element_text(self, locator_key):
         """
@@ -58,7 +75,7 @@ class WebElementOperations(SeleniumOperations):
         :return: Text content of the element
         :rtype: str
         """
-        return self.controller.get_element(self.controller.LOCATORS[locator_key]).text
+        return self.controller.get_element(self._resolve(locator_key)).text
 
     def op_get_element_enabled(self, locator_key):
         """
@@ -68,7 +85,7 @@ class WebElementOperations(SeleniumOperations):
         :return: True when element is enabled, False otherwise
         :rtype: bool
         """
-        return self.controller.get_element(self.controller.LOCATORS[locator_key]).is_enabled()
+        return self.controller.get_element(self._resolve(locator_key)).is_enabled()
 
     def op_get_element_visibility(self, locator_key):
         """
@@ -79,9 +96,9 @@ class WebElementOperations(SeleniumOperations):
         :return: True when element is visible, False otherwise
         :rtype: bool
         """
-        return self.controller.get_element(self.controller.LOCATORS[locator_key]).is_displayed()
+        return self.controller.get_element(self._resolve(locator_key)).is_displayed()
 
-    def op_get_element(self, locator_key, timeout=settings.SELENIUM['TIMEOUT']):
+    def op_get_element(self, locator_key, timeout=_TIMEOUT):
         """
         Locates and returns the element identified by locator_key
 
@@ -93,7 +110,7 @@ class WebElementOperations(SeleniumOperations):
         :return: Located web element
         :rtype: WebElement
         """
-        return self.controller.get_element(self.controller.LOCATORS[locator_key], timeout)
+        return self.controller.get_element(self._resolve(locator_key), timeout)
 
     def op_get_elements(self, locator_key):
         """
@@ -104,7 +121,43 @@ class WebElementOperations(SeleniumOperations):
         :return: Collection of matching web elements
         :rtype: list
         """
-        return self.controller.get_elements(self.controller.LOCATORS[locator_key])
+        return self.controller.get_elements(self._resolve(locator_key))
+
+    def op_read_many(self, locator_keys, fields):
+        """
+        Reads properties of several elements with a single round-trip, see :code:`read_many`
+
+        :param locator_keys: Dictionary keys for the locators collection
+        :type locator_keys: list
+        :param fields: Properties to read from each element, for example :code:`['text', 'enabled']`
+        :type fields: list
+        :return: Field values keyed by locator key, None for keys without a matching element
+        :rtype: dict
+        """
+        values = self.controller.read_many([self._resolve(locator_key) for locator_key in locator_keys], fields)
+        return dict(zip(locator_keys, values))
+
+    def op_gather(self, locator_keys, field='text', drivers=None):
+        """
+        Reads one property from several elements concurrently, see :code:`gather` for the
+        requirement that each driver is an independent session
+
+        :param locator_keys: Dictionary keys for the locators collection
+        :type locator_keys: list
+        :param field: Property to read from each element, any of :code:`ELEMENT_READERS`
+        :type field: str
+        :param drivers: Independent webdriver sessions to distribute the reads across
+        :type drivers: list
+        :return: Property values keyed by locator key
+        :rtype: dict
+        """
+        if field not in ELEMENT_READERS:
+            raise RuntimeError('Unsupported field for gathered read: {}'.format(field))
+        reader = ELEMENT_READERS[field]
+        values = self.gather([lambda driver, locator=self._resolve(locator_key):
+                              reader(SeleniumOperations(driver).get_element(locator))
+                              for locator_key in locator_keys], drivers)
+        return dict(zip(locator_keys, values))
 
     def op_get_element_value(self, locator_key):
         """
@@ -115,7 +168,7 @@ class WebElementOperations(SeleniumOperations):
         :return: Value attribute of the element
         :rtype: str
         """
-        return self.controller.get_element(self.controller.LOCATORS[locator_key]).get_attribute('value')
+        return self.controller.get_element(self._resolve(locator_key)).get_attribute('value')
 
     def op_wait_for_text_in_elements(self, locator_key, text):
         """
@@ -126,25 +179,25 @@ class WebElementOperations(SeleniumOperations):
         :param text: Text content to wait for
         :type text: str
         """
-        return self.controller.wait_for_text_in_elements(self.controller.LOCATORS[locator_key], text)
+        return self.controller.wait_for_text_in_elements(self._resolve(locator_key), text)
 
-    def op_wait_for_element_to_not_be_visible(self, locator_key, timeout=settings.SELENIUM['TIMEOUT']):
+    def op_wait_for_element_to_not_be_visible(self, locator_key, timeout=_TIMEOUT):
         """
         Waits until the element is no longer visible in the viewport
 
         :param locator_key: Dictionary key for the locators collection
         :type locator_key: str
         """
-        return self.controller.wait_for_element_to_not_be_visible(self.controller.LOCATORS[locator_key], timeout)
+        return self.controller.wait_for_element_to_not_be_visible(self._resolve(locator_key), timeout)
 
-    def op_browser_tap(self, locator_key, timeout=settings.SELENIUM['TIMEOUT']):
+    def op_browser_tap(self, locator_key, timeout=_TIMEOUT):
         """
         Performs a tap action on the element (browser-specific implementation)
 
         :param locator_key: Dictionary key for the locators collection
         :type locator_key: str
         """
-        return self.controller.browser_tap(self.controller.LOCATORS[locator_key], timeout)
+        return self.controller.browser_tap(self._resolve(locator_key), timeout)
 
     def op_swipe_until_visible(self, locator_key, attempts=3):
         """
@@ -158,4 +211,4 @@ class WebElementOperations(SeleniumOperations):
         :return: Located web element
         :rtype: WebElement
         """
-        return self.controller.swipe_until_visible(self.controller.LOCATORS[locator_key], attempts)
+        return self.controller.swipe_until_visible(self._resolve(locator_key), attempts)
@@ -28,3 +28,16 @@ RUNNING_ON_JENKINS = False
 MANAGED_DRIVERS = False
 #: Execute tests using desktop browsers via Selenium only (no Appium)
 DESKTOP_BROWSER = False
+#: Maximum number of reusable driver sessions per platform, 0 disables driver pooling
+POOL_SIZE = 0
+#: Reuse the cached test manifest instead of discovering test cases on every run, opt-in since the manifest
+#: does not track test methods inherited from outside the tests directory or suites built by load_tests
+TEST_MANIFEST_CACHE = False
+#: Number of worker processes executing the test suite, 1 runs tests serially
+WORKERS = 1
+#: Capabilities of the current platform resolved from settings.py after argument validation
+RESOLVED_CAPS = None
+#: Appium server URL resolved from settings.py after argument validation
+RESOLVED_APPIUM_URL = None
+#: GUS product tag of the current platform resolved from settings.py after argument validation
+RESOLVED_GUS_TAG = None
@@ -1,11 +1,12 @@
 # Native libraries
+import multiprocessing
 import time
 import os
 import unittest
 # Project libraries
 from qlty.classes.core.test_runner_utils import TestRunnerUtils
 from qlty.classes.core.test_reporter import TestReporter
-from qlty.utilities.utils import setup_logger
+from qlty.utilities.utils import setup_logger, get_unique_build_id
 import settings
 import qlty.config as config
 from qlty.utilities.argument_parser import QLTYArgumentParser
@@ -14,6 +15,8 @@ from qlty.utilities.argument_parser import QLTYArgumentParser
 test_reporter = TestReporter()
 # Logging instance for console output
 logger = setup_logger(__name__, settings.DEBUG_LEVEL)
+# Test case shards of a parallel run, inherited by forked worker processes
+_shards = []
 
 
 def _setup():
@@ -23,6 +26,10 @@ def _setup():
 
     # Generate unique identifier for this test session
     settings.TEST_RUN_ID = TestRunnerUtils.generate_test_run_id()
+    # Resolve the build identifier before parallel workers are forked so all of them report the same build
+    get_unique_build_id()
+    # Discard results collected by previous test runs in this process
+    test_reporter.reset()
     # Begin test execution
     _execute()
 
@@ -42,13 +49,18 @@ def _execute():
                 name='tests.' + config.CURRENT_PLATFORM + '.' + config.SINGLE_TEST_NAME)
     else:
         logger.debug('Loading full test collection')
-        test_suite = unittest.TestLoader().discover(os.path.join(os.getcwd(), 'tests'))
+        test_suite = TestRunnerUtils.discover_tests(os.path.join(os.getcwd(), 'tests'))
 
     # Begin timing test execution
     test_run_start_time = time.time()
     logger.debug('Starting test execution')
     try:
-        results = unittest.TextTestRunner(verbosity=1).run(test_suite)
+        if config.WORKERS > 1:
+            _execute_parallel(test_suite)
+        else:
+            results = unittest.TextTestRunner(verbosity=1).run(test_suite)
+            # Collect all test case results including failures and errors
+            test_reporter.get_results(results)
         logger.debug('Test execution completed successfully')
     except Exception as error:
         logger.critical('Test execution encountered an error: {}'.format(str(error)))
@@ -57,12 +69,49 @@ def _execute():
     # Calculate total execution duration
     test_run_elapsed_time = time.time() - test_run_start_time
 
-    _report(results, test_run_elapsed_time)
+    _report(test_run_elapsed_time)
+
+
+def _execute_parallel(test_suite):
+    """
+    Shards test cases round-robin across :code:`config.WORKERS` processes and merges their results
+
+    :param test_suite: Suite containing every test case of the run
+    :type test_suite: TestSuite
+    """
+    test_cases = list(TestRunnerUtils.iterate_tests(test_suite))
+    workers = min(config.WORKERS, len(test_cases)) or 1
+    # Workers are forked so they inherit parsed configuration and the loaded test cases
+    _shards[:] = [test_cases[index::workers] for index in range(workers)]
+    logger.debug('Executing {} test cases across {} workers'.format(len(test_cases), workers))
+    # Each process runs exactly one shard, a reused process would return the results of its previous shard
+    with multiprocessing.get_context('fork').Pool(processes=workers, maxtasksperchild=1) as pool:
+        shard_results = pool.map(_run_shard, range(workers), chunksize=1)
+    for test_results, external_case_ids in shard_results:
+        test_reporter.merge(test_results, external_case_ids)
+
+
+def _run_shard(shard_index):
+    """
+    Executes a single shard of test cases inside a worker process
+
+    :param shard_index: Index of the shard in :code:`_shards`
+    :type shard_index: int
+    :return: Test case results and external test case identifiers collected by the worker
+    :rtype: tuple
+    """
+    # Imported here to avoid loading the webdriver stack before command line arguments are validated
+    from qlty.classes.core.webdriver_pool import driver_pool
+    try:
+        results = unittest.TextTestRunner(verbosity=1).run(unittest.TestSuite(_shards[shard_index]))
+        test_reporter.get_results(results)
+    finally:
+        # Worker processes exit without running atexit handlers
+        driver_pool.drain()
+    return test_reporter.test_results, test_reporter.external_case_ids
 
 
-def _report(results, test_run_elapsed_time):
-    # Collect all test case results including failures and errors
-    test_reporter.get_results(results)
+def _report(test_run_elapsed_time):
     # Generate and distribute reports
     logger.debug('Generating test reports')
     TestRunnerUtils.report(test_reporter.test_results, settings.TEST_RUN_ID, test_run_elapsed_time)
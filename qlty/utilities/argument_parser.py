@@ -1,16 +1,70 @@
 # Native libraries
 import argparse
+import functools
+import logging
+import sys
 # Project libraries
 import os
 
-from qlty.utilities.utils import setup_logger, exists
-from qlty.classes.core.test_runner_utils import TestRunnerUtils
+from qlty.utilities.utils import setup_logger, get_nested
 import settings
 import qlty.config as config
 
 # Initialize logging instance
 logger = setup_logger(__name__, settings.DEBUG_LEVEL)
 
+#: Mobile browser and desktop browser flags for each supported platform
+_PLATFORM_KIND = {
+    'ios': (False, False),
+    'android': (False, False),
+    'android_web': (True, False),
+    'ios_web': (True, False),
+    'chrome': (False, True),
+    'firefox': (False, True),
+}
+
+#: Supported command line arguments as (flags, options) pairs for argparse
+_ARGUMENTS = (
+    # Platform selection
+    (('-p', '--platform'), dict(default=None, help='Target platform for automation: [ios | android]',
+                                choices=list(_PLATFORM_KIND),
+                                required=True, dest='platform')),
+    (('-s', '--slack'), dict(default=False, help='Enable Slack notifications for test results',
+                             required=False, dest='slack_reporting', action='store_true')),
+    (('-t', '--test'), dict(default=None, help='Execute a specific test case', required=False,
+                            dest='single_test')),
+    (('-u', '--update-automation'), dict(default=False, help='Update automation flags for executed test cases',
+                                         required=False, dest='update_automation', action='store_true')),
+    (('-f', '--report-on-fail'), dict(default=False, help='Generate reports even for failed tests',
+                                      required=False, dest='report_on_fail', action='store_true')),
+    (('-l', '--saucelabs'), dict(default=False, help='Execute tests on Saucelabs cloud platform',
+                                 required=False, dest='saucelabs', action='store_true')),
+    (('-d', '--managed'), dict(default=False, help='Use automated driver management',
+                               required=False, dest='managed_drivers', action='store_true')),
+    (('-o', '--pool-size'), dict(default=0, type=int,
+                                 help='Reuse up to N driver sessions across test cases, 0 disables pooling. '
+                                      'Native apps are restarted and browser cookies deleted between test cases',
+                                 required=False, dest='pool_size')),
+    (('-c', '--cache'), dict(default=False, help='Reuse the cached test manifest instead of discovering test cases',
+                             required=False, dest='cache', action='store_true')),
+    (('-w', '--workers'), dict(default=1, type=int, help='Execute the test suite across N worker processes',
+                               required=False, dest='workers')),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """
+    Builds the command line parser once per process, later runs in the same process reuse it
+
+    :return: Parser configured with every supported argument
+    :rtype: ArgumentParser
+    """
+    parser = argparse.ArgumentParser()
+    for flags, options in _ARGUMENTS:
+        parser.add_argument(*flags, **options)
+    return parser
+
 
 class QLTYArgumentParser:
     """
@@ -21,43 +75,28 @@ class QLTYArgumentParser:
         """
         Initialize argument parser and process command line inputs
         """
-        self.parser = argparse.ArgumentParser()
-        self._prepare_arguments()
+        self.parser = _get_parser()
         self._parse_arguments()
         self._validate_arguments()
+        self._resolve_settings()
         self._print_arguments()
 
-    def _prepare_arguments(self):
-        """
-        Configures all supported command line arguments for the parser
-        """
-        # Define all available command line arguments
-        # Platform selection
-        self.parser.add_argument('-p', '--platform', default=None, help='Target platform for automation: [ios | android]',
-                                 choices=['ios', 'android', 'android_web', 'ios_web', 'chrome', 'firefox'],
-                                 required=True, dest='platform')
-        self.parser.add_argument('-s', '--slack', default=False, help='Enable Slack notifications for test results',
-                                 required=False, dest='slack_reporting', action='store_true')
-        self.parser.add_argument('-t', '--test', default=None, help='Execute a specific test case', required=False,
-                                 dest='single_test')
-        self.parser.add_argument('-u', '--update-automation', default=False,
-                                 help='Update automation flags for executed test cases', required=False,
-                                 dest='update_automation', action='store_true')
-        self.parser.add_argument('-f', '--report-on-fail', default=False, help='Generate reports even for failed tests',
-                                 required=False, dest='report_on_fail', action='store_true')
-        self.parser.add_argument('-l', '--saucelabs', default=False,
-                                 help='Execute tests on Saucelabs cloud platform', required=False,
-                                 dest='saucelabs', action='store_true')
-        self.parser.add_argument('-d', '--managed', default=False,
-                                 help='Use automated driver management', required=False,
-                                 dest='managed_drivers', action='store_true')
-
     def _parse_arguments(self):
         """
         Processes command line arguments and maps them to configuration settings
         """
         # Extract parsed arguments
         args = self.parser.parse_args()
+        # Reject option values and combinations that cannot be executed, parser.error exits with usage
+        if args.pool_size < 0:
+            self.parser.error('--pool-size must be 0 or greater')
+        if args.pool_size > 0 and args.saucelabs:
+            self.parser.error('--pool-size is not supported with --saucelabs, results are posted per session')
+        if args.workers < 1:
+            self.parser.error('--workers must be 1 or greater')
+        if args.workers > 1 and sys.platform == 'darwin':
+            # Workers are forked, which is unsafe on macOS once the networking and SSL libraries are loaded
+            self.parser.error('--workers greater than 1 is not supported on macOS')
 
         # Map arguments to configuration variables
         config.CURRENT_PLATFORM = args.platform
@@ -67,28 +106,38 @@ class QLTYArgumentParser:
         config.REPORT_ON_FAIL = args.report_on_fail
         config.SAUCELABS_INTEGRATION = args.saucelabs
         config.MANAGED_DRIVERS = args.managed_drivers
-        config.MOBILE_BROWSER = False
-        config.DESKTOP_BROWSER = False
+        config.POOL_SIZE = args.pool_size
+        config.TEST_MANIFEST_CACHE = args.cache
+        config.WORKERS = args.workers
+        # Detect mobile and desktop browser testing modes
+        config.MOBILE_BROWSER, config.DESKTOP_BROWSER = _PLATFORM_KIND[args.platform]
 
-        # Detect mobile browser testing mode
-        if 'android_web' in args.platform or 'ios_web' in args.platform:
-            config.MOBILE_BROWSER = True
-        # Detect desktop browser testing mode
-        if 'chrome' in args.platform or 'firefox' in args.platform:
-            config.DESKTOP_BROWSER = True
+    def _resolve_settings(self):
+        """
+        Stores settings used on every driver creation for the selected platform in the configuration
+        """
+        config.RESOLVED_CAPS = get_nested(settings, 'SELENIUM', 'CAPABILITIES', config.CURRENT_PLATFORM)
+        config.RESOLVED_APPIUM_URL = get_nested(settings, 'SELENIUM', 'APPIUM', 'URL')
+        config.RESOLVED_GUS_TAG = get_nested(settings, 'GUS', 'PRODUCT_TAG', config.CURRENT_PLATFORM.upper())
 
     def _print_arguments(self):
         """
         Outputs current configuration state for debugging purposes
         """
-        logger.debug('Target platform: {}'.format(config.CURRENT_PLATFORM))
-        logger.debug('Managed drivers enabled: {}'.format(config.MANAGED_DRIVERS))
-        logger.debug('Slack reporting enabled: {}'.format(config.SLACK_REPORTING))
-        logger.debug('Single test execution: {}'.format(config.SINGLE_TEST_NAME))
-        logger.debug('Report on failure: {}'.format(config.REPORT_ON_FAIL))
-        logger.debug('Saucelabs Integration enabled: {}'.format(config.SAUCELABS_INTEGRATION))
-        logger.debug('Mobile browser mode: {}'.format(config.MOBILE_BROWSER))
-        logger.debug('Jenkins execution detected: {}'.format(config.RUNNING_ON_JENKINS))
+        # Every line below is debug output, skip the block entirely when debug logging is disabled
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug('Target platform: %s', config.CURRENT_PLATFORM)
+        logger.debug('Managed drivers enabled: %s', config.MANAGED_DRIVERS)
+        logger.debug('Driver pool size: %s', config.POOL_SIZE)
+        logger.debug('Test manifest cache enabled: %s', config.TEST_MANIFEST_CACHE)
+        logger.debug('Worker processes: %s', config.WORKERS)
+        logger.debug('Slack reporting enabled: %s', config.SLACK_REPORTING)
+        logger.debug('Single test execution: %s', config.SINGLE_TEST_NAME)
+        logger.debug('Report on failure: %s', config.REPORT_ON_FAIL)
+        logger.debug('Saucelabs Integration enabled: %s', config.SAUCELABS_INTEGRATION)
+        logger.debug('Mobile browser mode: %s', config.MOBILE_BROWSER)
+        logger.debug('Jenkins execution detected: %s', config.RUNNING_ON_JENKINS)
 
     def _validate_arguments(self):
         """
@@ -100,70 +149,57 @@ class QLTYArgumentParser:
         else:
             logger.info('Reporting enabled regardless of test execution outcome')
 
-        missing_settings = False
+        errors = []
         # Validate platform capabilities configuration
         # Verify capabilities structure exists
-        if exists(lambda: settings.SELENIUM['CAPABILITIES']) is None:
-            logger.error('No capabilities configured in `settings.py` file')
-            missing_settings = True
-
-        # Validate platform-specific capabilities
-        if exists(lambda: settings.SELENIUM['CAPABILITIES'][config.CURRENT_PLATFORM]) is None\
-                and not config.MANAGED_DRIVERS:
-            logger.error('Missing capability configuration for `{}` in `settings.py` file'.format(
+        if get_nested(settings, 'SELENIUM', 'CAPABILITIES') is None:
+            errors.append('No capabilities configured in `settings.py` file')
+
+        # Validate platform-specific capabilities, not used when drivers are managed by the test cases
+        if not config.MANAGED_DRIVERS \
+                and get_nested(settings, 'SELENIUM', 'CAPABILITIES', config.CURRENT_PLATFORM) is None:
+            errors.append('Missing capability configuration for `{}` in `settings.py` file'.format(
                 config.CURRENT_PLATFORM))
-            missing_settings = True
 
         # Validate Slack integration requirements
         if config.SLACK_REPORTING:
-            if exists(lambda: settings.SLACK['SLACK_AUTH_TOKEN']) is None:
-                logger.error('Slack integration requires authentication token environment variable')
-                missing_settings = True
-            if exists(lambda: settings.SLACK['CHANNEL_ID']) is None:
-                logger.error('Slack integration requires channel id configuration in `settings.py` file')
-                missing_settings = True
-            if exists(lambda: settings.PROJECT_CONFIG['RELEASE']) is None:
-                logger.error('Slack integration requires RELEASE configuration in `settings.py` file')
-                missing_settings = True
-            if exists(lambda: settings.PROJECT_CONFIG['PROJECT_NAME']) is None:
-                logger.error('Slack integration requires PROJECT_NAME configuration in `settings.py` file')
-                missing_settings = True
-            if exists(lambda: settings.PROJECT_CONFIG['ENVIRONMENT']) is None:
-                logger.error('Slack integration requires ENVIRONMENT configuration in `settings.py` file')
-                missing_settings = True
+            if get_nested(settings, 'SLACK', 'SLACK_AUTH_TOKEN') is None:
+                errors.append('Slack integration requires authentication token environment variable')
+            if get_nested(settings, 'SLACK', 'CHANNEL_ID') is None:
+                errors.append('Slack integration requires channel id configuration in `settings.py` file')
+            if get_nested(settings, 'PROJECT_CONFIG', 'RELEASE') is None:
+                errors.append('Slack integration requires RELEASE configuration in `settings.py` file')
+            if get_nested(settings, 'PROJECT_CONFIG', 'PROJECT_NAME') is None:
+                errors.append('Slack integration requires PROJECT_NAME configuration in `settings.py` file')
+            if get_nested(settings, 'PROJECT_CONFIG', 'ENVIRONMENT') is None:
+                errors.append('Slack integration requires ENVIRONMENT configuration in `settings.py` file')
 
         # Validate Saucelabs integration requirements
         if config.SAUCELABS_INTEGRATION and not config.MANAGED_DRIVERS:
             # Verify Saucelabs-specific capability configuration
-            if exists(lambda: settings.SELENIUM['CAPABILITIES'][config.CURRENT_PLATFORM + '_saucelabs']) is None:
-                logger.error(
-                    'Missing capability configuration for `{}_saucelabs` in `settings.py` file'.format(
-                        config.CURRENT_PLATFORM))
-                missing_settings = True
-
-            if exists(lambda: settings.SAUCELABS['USERNAME']) is None:
-                logger.error('Saucelabs integration requires USERNAME in `settings.py` file')
-                missing_settings = True
-            if exists(lambda: settings.SAUCELABS['ACCESS_KEY']) is None:
-                logger.error('Saucelabs integration requires ACCESS_KEY configuration in `settings.py` file')
-                missing_settings = True
-            if exists(lambda: settings.SAUCELABS['URL']) is None:
-                logger.error('Saucelabs integration requires URL in `settings.py` file')
-                missing_settings = True
+            if get_nested(settings, 'SELENIUM', 'CAPABILITIES', config.CURRENT_PLATFORM + '_saucelabs') is None:
+                errors.append('Missing capability configuration for `{}_saucelabs` in `settings.py` file'.format(
+                    config.CURRENT_PLATFORM))
+
+            if get_nested(settings, 'SAUCELABS', 'USERNAME') is None:
+                errors.append('Saucelabs integration requires USERNAME in `settings.py` file')
+            if get_nested(settings, 'SAUCELABS', 'ACCESS_KEY') is None:
+                errors.append('Saucelabs integration requires ACCESS_KEY configuration in `settings.py` file')
+            if get_nested(settings, 'SAUCELABS', 'URL') is None:
+                errors.append('Saucelabs integration requires URL in `settings.py` file')
 
         # Validate Jenkins environment configuration
-        if os.getenv('JENKINS_URL', None):
-            logger.info('Jenkins execution detected: [{}]'.format(
-                os.getenv('JENKINS_URL', 'Could not retrieve JENKINS_URL')))
+        jenkins_url = os.getenv('JENKINS_URL')
+        if jenkins_url:
+            logger.info('Jenkins execution detected: [{}]'.format(jenkins_url))
             config.RUNNING_ON_JENKINS = True
-            if exists(lambda: settings.JENKINS['JOBS'][config.CURRENT_PLATFORM]) is None:
-                logger.error('Jenkins execution requires relative job url configuration in `settings.py` file')
-                missing_settings = True
-
-        # Abort execution if required settings are missing
-        if missing_settings:
-            logger.error('One or more required settings are missing from `settings.py` file\n'
-                         'Please refer to the documentation for configuration details')
-            exit(1)
+            if get_nested(settings, 'JENKINS', 'JOBS', config.CURRENT_PLATFORM) is None:
+                errors.append('Jenkins execution requires relative job url configuration in `settings.py` file')
+
+        # Abort execution if required settings are missing, reporting every problem in a single message
+        if errors:
+            logger.error('One or more required settings are missing from `settings.py` file:\n  - {}\n'
+                         'Please refer to the documentation for configuration details'.format('\n  - '.join(errors)))
+            sys.exit(1)
 
         logger.info('Configuration validation successful for selected integrations')
@@ -1,5 +1,6 @@
 # Native libraries
 import os
+import weakref
 # Third party libraries
 from appium import webdriver
 from selenium import webdriver as desktop_webdriver
@@ -19,6 +20,12 @@ from qlty.utilities.utils import is_browser_run
 
 # Configure logging instance
 logger = setup_logger(__name__, settings.DEBUG_LEVEL)
+# Timeout for context switches
+_TIMEOUT = settings.SELENIUM['TIMEOUT']
+# Touch pointer arguments, input devices record their actions so a new one is created for every gesture
+_TOUCH_POINTER = (interaction.POINTER_TOUCH, 'touch')
+# Window sizes keyed by driver, entries are dropped with the driver or when its session is terminated
+_window_sizes = weakref.WeakKeyDictionary()
 
 
 def wait_for_web_context(driver, webview_name):
@@ -31,18 +38,19 @@ def wait_for_web_context(driver, webview_name):
     :type webview_name: str
     """
     logger.debug('Awaiting available web context')
-    # Wait for WEBVIEW context with specified name to become available
-    WebDriverWait(driver, settings.SELENIUM['TIMEOUT']).until(
-        lambda x: len([context for context in driver.contexts if webview_name in context]) > 0,
-        message='Web context with qualified app name [{}] never became available'.format(webview_name))
-    web_context = ''
-    for c in driver.contexts:
-        if webview_name in c:
-            web_context = c
-    if web_context == '':
-        logger.error('Failed to retrieve web context, available contexts:\n{}'.format(driver.contexts))
-    else:
-        logger.debug('Switching to context: {}'.format(web_context))
+
+    def probe(x):
+        # Single scan per poll, the last matching context is selected
+        web_context = None
+        for context in x.contexts:
+            if webview_name in context:
+                web_context = context
+        return web_context
+
+    # Wait for WEBVIEW context with specified name to become available, the wait returns the matching context
+    web_context = WebDriverWait(driver, _TIMEOUT).until(
+        probe, message='Web context with qualified app name [{}] never became available'.format(webview_name))
+    logger.debug('Switching to context: %s', web_context)
 
     driver.switch_to.context(web_context)
 
@@ -74,27 +82,41 @@ def initialize_driver(test_case, platform, force_driver_creation=True):
         logger.info('Test execution using managed drivers, skipping default web driver initialization')
         return None
 
-    driver = None
-    # Configure Saucelabs remote driver if integration enabled
-    if config.SAUCELABS_INTEGRATION and not is_browser_run(platform):
-        driver = SaucelabsHelper.get_saucelabs_appium_remote(test_case, platform)
-    else:
-        # Initialize local webdriver instance
-        if config.DESKTOP_BROWSER:
-            driver = get_desktop_webdriver()
-        else:
-            # Retrieve platform-specific capabilities
-            capabilities = settings.SELENIUM['CAPABILITIES'][platform]
-            appium_remote = settings.SELENIUM['APPIUM']['URL']
-            driver = webdriver.Remote(appium_remote, options=AppiumOptions().load_capabilities(capabilities))
+    driver = create_driver(test_case, platform)
 
     if driver is not None:
         # Register driver with test case
-        logger.debug('Registering single driver with test case: session_id[{}]'.format(driver.session_id))
+        logger.debug('Registering single driver with test case: session_id[%s]', driver.session_id)
         test_case.drivers.append(driver)
         return driver
 
 
+def create_driver(test_case, platform):
+    """
+    Creates a new driver session for the given platform without registering it with the test case
+
+    :param test_case: A QLTY test case for retrieving class and method names
+    :type: QLTYTestcase
+    :param platform: Platform identifier string for webdriver selection
+    :type: String
+    :return: Newly created driver instance
+    :rtype: WebDriver
+    """
+    # Configure Saucelabs remote driver if integration enabled
+    if config.SAUCELABS_INTEGRATION and not is_browser_run(platform):
+        return SaucelabsHelper.get_saucelabs_appium_remote(test_case, platform)
+    # Initialize local webdriver instance
+    if config.DESKTOP_BROWSER:
+        return get_desktop_webdriver()
+    # Retrieve platform-specific capabilities, resolved once for the platform selected on the command line
+    if platform == config.CURRENT_PLATFORM and config.RESOLVED_CAPS is not None:
+        capabilities = config.RESOLVED_CAPS
+    else:
+        capabilities = settings.SELENIUM['CAPABILITIES'][platform]
+    appium_remote = config.RESOLVED_APPIUM_URL or settings.SELENIUM['APPIUM']['URL']
+    return webdriver.Remote(appium_remote, options=AppiumOptions().load_capabilities(capabilities))
+
+
 def get_desktop_webdriver():
     """
     Creates desktop browser webdriver instance from drivers directory
@@ -112,16 +134,38 @@ def perform_tap_back(driver):
     Executes back navigation action
     """
     if config.CURRENT_PLATFORM == 'ios':
-        actions = ActionChains(driver)
-        actions.w3c_actions = ActionBuilder(driver, mouse=PointerInput(interaction.POINTER_TOUCH, "touch"))
-        actions.w3c_actions.pointer_action.move_to_location(0, 0)
-        actions.w3c_actions.pointer_action.pointer_down()
-        actions.w3c_actions.pointer_action.release()
-        actions.perform()
+        _tap(driver, 0, 0)
     else:
         driver.back()
 
 
+def get_window_size(driver):
+    """
+    Retrieves the window size of the driver session, fetched once per session and shared by every
+    gesture helper, including :code:`SeleniumOperations` swipes
+
+    :param driver: Active driver instance
+    :type driver: WebDriver
+    :return: Dictionary with width and height of the window in pixels
+    :rtype: dict
+    """
+    size = _window_sizes.get(driver)
+    if size is None:
+        size = _window_sizes[driver] = driver.get_window_size()
+    return size
+
+
+def invalidate_window_size(driver):
+    """
+    Discards the cached window size of the driver session, call after rotating the device, resizing the window
+    or terminating the session
+
+    :param driver: Active driver instance
+    :type driver: WebDriver
+    """
+    _window_sizes.pop(driver, None)
+
+
 def perform_tap_location(driver, offset):
     """
     Executes tap gesture using percentage-based coordinates
@@ -131,22 +175,36 @@ def perform_tap_location(driver, offset):
     :param offset: Coordinate dictionary with offset_x and offset_y percentages
     :type offset: dict
     """
-    tap_x = (offset['offset_x'] * driver.get_window_size()['width'])
-    tap_y = (offset['offset_y'] * driver.get_window_size()['height'])
-    perform_tap_based_on_cords(driver, {'x': tap_x, 'y': tap_y})
+    size = get_window_size(driver)
+    tap_x = (offset['offset_x'] * size['width'])
+    tap_y = (offset['offset_y'] * size['height'])
+    _tap(driver, tap_x, tap_y)
 
 
 def perform_tap_based_on_cords(driver, coords):
     """
     Executes tap gesture using absolute viewport coordinates
     """
-    x = coords['x']
-    y = coords['y']
+    _tap(driver, coords['x'], coords['y'])
+
+
+def _tap(driver, x, y):
+    """
+    Performs a single touch tap at absolute viewport coordinates
+
+    :param driver: Active driver instance
+    :type driver: WebDriver
+    :param x: Horizontal coordinate in pixels
+    :type x: float
+    :param y: Vertical coordinate in pixels
+    :type y: float
+    """
     actions = ActionChains(driver)
-    actions.w3c_actions = ActionBuilder(driver, mouse=PointerInput(interaction.POINTER_TOUCH, "touch"))
-    actions.w3c_actions.pointer_action.move_to_location(x, y)
-    actions.w3c_actions.pointer_action.pointer_down()
-    actions.w3c_actions.pointer_action.release()
+    actions.w3c_actions = ActionBuilder(driver, mouse=PointerInput(*_TOUCH_POINTER))
+    pointer_action = actions.w3c_actions.pointer_action
+    pointer_action.move_to_location(x, y)
+    pointer_action.pointer_down()
+    pointer_action.release()
     actions.perform()
 
 
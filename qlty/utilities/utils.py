@@ -1,66 +1,82 @@
 # Native libraries
+import functools
+import json
 import os
 import uuid
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 # Third party libraries
 import colorlog
-from pprint import pformat
 # Project libraries
 import settings
 import qlty.config as config
 
-#: Predefined coordinate offsets for Android swipe gestures
-ANDROID_SWIPE_OFFSETS = {
-    'up': {
+#: Predefined coordinate offsets for Android swipe gestures, read-only
+ANDROID_SWIPE_OFFSETS = MappingProxyType({
+    'up': MappingProxyType({
         'start_x': 0.5,
         'start_y': 0.9,  # Starting at 90% height to avoid Android navigation bar interference
         'end_x': 0.5,
         'end_y': 0
-    },
-    'down': {
+    }),
+    'down': MappingProxyType({
         'start_x': 0.5,
         'start_y': 0.9,
         'end_x': 0.5,
         'end_y': 0.45
-    },
-    'up_30_percent': {
+    }),
+    'up_30_percent': MappingProxyType({
         'start_x': 0.5,
         'start_y': 0.8,
         'end_x': 0.5,
         'end_y': 0.5
-    },
-    'up_10_percent': {
+    }),
+    'up_10_percent': MappingProxyType({
         'start_x': 0.5,
         'start_y': 0.8,
         'end_x': 0.5,
         'end_y': 0.7,
-    },
-    'down_40_percent': {
+    }),
+    'down_40_percent': MappingProxyType({
         'start_x': 0.5,
         'start_y': 0.5,
         'end_x': 0.5,
         'end_y': 0.9
-    }
-}
-#: Predefined coordinate offsets for iOS swipe gestures
-IOS_SWIPE_OFFSETS = {
-    'middle_swipe': {
+    })
+})
+#: Predefined coordinate offsets for iOS swipe gestures, read-only
+IOS_SWIPE_OFFSETS = MappingProxyType({
+    'middle_swipe': MappingProxyType({
         'start_x': 1,
         'start_y': 0.5,
         'end_x': 0,
         'end_y': 0.5
-    },
-    'up': {
+    }),
+    'up': MappingProxyType({
         'direction': 'up'
-    },
-    'left': {
+    }),
+    'left': MappingProxyType({
         'direction': 'left'
-    }
-}
+    })
+})
 #: Global reference to current test session identifier
 CURRENT_TEST_RUN_ID = None
 
 
+#: Colored console formatter shared by every framework logger
+_FORMATTER = colorlog.ColoredFormatter(
+    '%(asctime)s %(log_color)s - %(levelname)s | :%(name)s:%(message)s', datefmt='%m/%d %H:%M:%S',
+    log_colors={
+        'DEBUG': 'cyan',
+        'INFO': 'blue',
+        'WARNING': 'yellow',
+        'ERROR': 'red',
+        'CRITICAL': 'black,bg_red',
+    },
+)
+
+
 def setup_logger(name, debug_level):
     """
     Creates and configures a logger instance with color formatting.
@@ -74,23 +90,15 @@ def setup_logger(name, debug_level):
     """
     # Initialize or retrieve logger by name
     new_logger = logging.getLogger(name)
+    new_logger.setLevel(debug_level)
+    # Loggers configured by a previous call already have their handler
+    if new_logger.handlers:
+        return new_logger
+
     # Configure colored console output handler
     handler = colorlog.StreamHandler()
-    handler.setFormatter(colorlog.ColoredFormatter(
-        '%(asctime)s %(log_color)s - %(levelname)s | :%(name)s:%(message)s', datefmt='%m/%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'blue',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'black,bg_red',
-        },
-    ))
-
-    # Attach formatters only to newly created loggers
-    if not new_logger.handlers:
-        new_logger.addHandler(handler)
-    new_logger.setLevel(debug_level)
+    handler.setFormatter(_FORMATTER)
+    new_logger.addHandler(handler)
     return new_logger
 
 
@@ -108,8 +116,24 @@ def get_uuid():
     return '[{}]'.format(str(uuid.uuid4())[:6])
 
 
-#: Unique identifier for current test execution session
-BUILD_ID = get_uuid()
+@functools.lru_cache(maxsize=1)
+def _build_id():
+    """
+    Generates the unique identifier for the current test execution session on first use
+
+    :return: Shortened unique 6-character identifier
+    :rtype: str
+    """
+    return get_uuid()
+
+
+def __getattr__(name):
+    """
+    Resolves :code:`BUILD_ID` lazily for modules that read it as an attribute
+    """
+    if name == 'BUILD_ID':
+        return _build_id()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 def dump_test_results(test_case):
@@ -121,33 +145,18 @@ def dump_test_results(test_case):
     :return: Absolute path to the test method results directory
     :rtype: str
     """
-    class_name = test_case.__class__.__qualname__
-    method_name = test_case._testMethodName
-
-    # Build directory hierarchy
-    results_dir = os.path.join(os.getcwd(), 'test_results')
-    test_run_dir = os.path.join(results_dir, settings.TEST_RUN_ID)
-    class_dir = os.path.join(test_run_dir, class_name)
-    method_dir = os.path.join(class_dir, method_name)
-
-    # Verify test run directory existence
-    if not os.path.exists(results_dir):
-        logger.debug('Test results directory missing, creating now')
-        os.makedirs(test_run_dir)
-        logger.debug('Test results directory created at:\n{}'.format(test_run_dir))
-
-    # Verify class-level directory existence
-    if not os.path.exists(class_dir):
-        logger.debug('Test results directory for class {} not found'.format(class_name))
-        os.makedirs(class_dir)
-        logger.debug('{} directory created successfully'.format(class_dir))
-
-    # Create method-specific directory
-    os.makedirs(method_dir)
-    logger.debug('{} directory created successfully'.format(method_dir))
+    # Build directory hierarchy, missing parent directories are created along with the method directory
+    method_dir = os.path.join(os.getcwd(), 'test_results', settings.TEST_RUN_ID,
+                              test_case.__class__.__qualname__, test_case._testMethodName)
+    os.makedirs(method_dir, exist_ok=True)
+    logger.debug('%s directory created successfully', method_dir)
     return method_dir
 
 
+#: Driver log type holding system logs for each mobile platform
+_SYSTEM_LOG_TYPES = {'android': 'logcat', 'ios': 'syslog'}
+
+
 def dump_logs(results_dir, driver):
     """
     Extracts and saves logs to the test method results directory
@@ -160,16 +169,17 @@ def dump_logs(results_dir, driver):
     # Save page source structure
     driver_page_source_path = os.path.join(results_dir, 'page_source.txt')
     with open(driver_page_source_path, 'w') as opened_file:
-        opened_file.write(pformat(driver.page_source))
+        # Page source is already a string, written as is
+        opened_file.write(driver.page_source)
 
     # Save platform-specific system logs
     log_path = os.path.join(results_dir, 'system.log')
+    log_type = _SYSTEM_LOG_TYPES.get(config.CURRENT_PLATFORM)
     with open(log_path, 'w') as opened_file:
-        if config.CURRENT_PLATFORM == 'android':
-            opened_file.write(pformat(driver.get_log('logcat')))
-        elif config.CURRENT_PLATFORM == 'ios':
-            opened_file.write(pformat(driver.get_log('syslog')))
-    logger.debug('Logs saved to: {}'.format(log_path))
+        if log_type:
+            # One JSON encoded log entry per line
+            opened_file.writelines(json.dumps(entry) + '\n' for entry in driver.get_log(log_type))
+    logger.debug('Logs saved to: %s', log_path)
 
 
 def dump_screenshot(results_dir, test_case, driver):
@@ -187,7 +197,7 @@ def dump_screenshot(results_dir, test_case, driver):
         # Test method has encountered a failure
         screenshot_path = os.path.join(results_dir, 'screenshot.png')
         driver.save_screenshot(screenshot_path)
-        logger.debug('Screenshot captured at: {}'.format(screenshot_path))
+        logger.debug('Screenshot captured at: %s', screenshot_path)
 
 
 def get_gus_product_tag():
@@ -196,6 +206,8 @@ def get_gus_product_tag():
     :return: Product tag string for GUS integration
     :rtype: str
     """
+    if config.RESOLVED_GUS_TAG is not None:
+        return config.RESOLVED_GUS_TAG
     return settings.GUS['PRODUCT_TAG'][str.upper(config.CURRENT_PLATFORM)]
 
 
@@ -218,15 +230,40 @@ def exists(var):
         logger.error('Variable not found: {}'.format(error))
 
 
+def get_nested(root, *path):
+    """
+    Walks nested attributes and dictionary keys without raising or logging on missing entries:
+
+        .. code-block:: python
+
+            get_nested(settings, 'SELENIUM', 'CAPABILITIES', 'ios')
+
+    :param root: Object or dictionary to start the lookup from
+    :param path: Attribute names or dictionary keys to follow in order
+    :return: Value found at the end of the path, None if any entry is missing
+    """
+    current = root
+    for key in path:
+        if isinstance(current, Mapping):
+            current = current.get(key)
+        else:
+            current = getattr(current, key, None)
+        if current is None:
+            return None
+    return current
+
+
+@functools.lru_cache(maxsize=1)
 def get_unique_build_id():
     """
     Generates a unique build identifier for this test execution session
+    Computed once per process since the identifier does not change during a test run
 
     :return: Unique build identifier string
     :rtype: String
     """
     return '{} {} | {}'.format(
-        BUILD_ID,
+        _build_id(),
         settings.PROJECT_CONFIG['PROJECT_NAME'],
         settings.PROJECT_CONFIG['RELEASE'])
 
@@ -240,4 +277,4 @@ def is_browser_run(platform):
     :return: True if execution targets desktop browser
     :rtype: bool
     """
-    return platform == 'chrome' or platform == 'firefox'
+    return platform in ('chrome', 'firefox')
@@ -23,8 +23,12 @@ setuptools.setup(
               'qlty.classes.selenium',
               'qlty.classes.core'
               ],
-    install_requires=['requests', 'Appium-Python-Client', 'colorlog', 'numpy',
-                      'cython', 'pyjnius', 'slack-sdk', 'boto3', 'sphinx-rtd-theme'],
+    install_requires=['requests', 'Appium-Python-Client', 'colorlog', 'slack-sdk', 'boto3'],
+    extras_require={
+        'docs': ['sphinx-rtd-theme'],
+        'android': ['cython', 'pyjnius'],
+        'numeric': ['numpy'],
+    },
     package_data={'': ['*.jar']},
     include_package_data=True,
 )